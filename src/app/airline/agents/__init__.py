@@ -31,11 +31,22 @@ from .handoff_callbacks import on_seat_booking_handoff, on_booking_handoff
 # This runs at import time, after all agents are created.
 # The order matters for some operations, but extend/append are safe.
 
+# One wrapper per (agent, callback) pair, shared by every agent that routes there
+_booking_handoff = handoff(agent=booking_cancellation_agent, on_handoff=on_booking_handoff)
+_seat_handoff = handoff(agent=seat_special_services_agent, on_handoff=on_seat_booking_handoff)
+
+# Target agent name -> on_handoff callback name, shown in the Runner panel. Every handoff
+# to these agents goes through the wrappers above, so the target alone identifies the callback.
+HANDOFF_CALLBACK_NAMES: dict[str, str] = {
+    _booking_handoff.agent_name: on_booking_handoff.__name__,
+    _seat_handoff.agent_name: on_seat_booking_handoff.__name__,
+}
+
 # Triage can hand off to all specialists
 triage_agent.handoffs = [
     flight_information_agent,
-    handoff(agent=booking_cancellation_agent, on_handoff=on_booking_handoff),
-    handoff(agent=seat_special_services_agent, on_handoff=on_seat_booking_handoff),
+    _booking_handoff,
+    _seat_handoff,
     faq_agent,
     refunds_compensation_agent,
 ]
@@ -48,13 +59,13 @@ seat_special_services_agent.handoffs.extend([refunds_compensation_agent, triage_
 
 # Flight info can hand off to booking or return to triage
 flight_information_agent.handoffs.extend([
-    handoff(agent=booking_cancellation_agent, on_handoff=on_booking_handoff),
+    _booking_handoff,
     triage_agent,
 ])
 
 # Booking can hand off to seat services, refunds, or return to triage
 booking_cancellation_agent.handoffs.extend([
-    handoff(agent=seat_special_services_agent, on_handoff=on_seat_booking_handoff),
+    _seat_handoff,
     refunds_compensation_agent,
     triage_agent,
 ])
@@ -63,6 +74,35 @@ booking_cancellation_agent.handoffs.extend([
 refunds_compensation_agent.handoffs.extend([faq_agent, triage_agent])
 
 
+async def warmup() -> None:
+    """
+    Prepare agents before the first user turn (run from the app's startup hooks).
+    
+    Renders each agent's instructions once so module templates and render caches
+    are populated, then warms the Azure OpenAI token and connection pool.
+    """
+    from types import SimpleNamespace
+
+    from agents import RunContextWrapper
+
+    from ...azure_client import warmup as warmup_azure_client
+    from ..context import create_initial_context
+
+    # Instruction callbacks only read context.state, so a bare namespace stands in for the chat context
+    run_context = RunContextWrapper(context=SimpleNamespace(state=create_initial_context()))
+    for agent in (
+        triage_agent,
+        faq_agent,
+        seat_special_services_agent,
+        flight_information_agent,
+        booking_cancellation_agent,
+        refunds_compensation_agent,
+    ):
+        if callable(agent.instructions):
+            agent.instructions(run_context, agent)
+    await warmup_azure_client()
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -77,4 +117,7 @@ __all__ = [
     # Callbacks (for reference/testing)
     "on_seat_booking_handoff",
     "on_booking_handoff",
+    "HANDOFF_CALLBACK_NAMES",
+    # Startup
+    "warmup",
 ]
@@ -5,34 +5,38 @@ and flight cancellations with automatic seat assignment.
 """
 from agents import Agent, RunContextWrapper
 
-from ...azure_client import MODEL
+from ...azure_client import get_model
 from ..context import AirlineAgentChatContext
-from ..guardrails import relevance_guardrail, jailbreak_guardrail
-from ..prompts.loader import load_prompt
+from ..guardrails import DEFAULT_INPUT_GUARDRAILS
+from ..prompts.loader import UNKNOWN, compile_prompt
 from ..tools import cancel_flight, get_matching_flights, book_new_flight
 
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 
 
+_render_booking = compile_prompt(
+    "booking", {"RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX}, "confirmation", "flight"
+)
+
+
 def booking_cancellation_instructions(
     run_context: RunContextWrapper[AirlineAgentChatContext], agent: Agent[AirlineAgentChatContext]
 ) -> str:
     """Load booking/cancellation prompt with context variables."""
     ctx = run_context.context.state
-    return load_prompt("booking", {
-        "RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX,
-        "confirmation": ctx.confirmation_number or "[unknown]",
-        "flight": ctx.flight_number or "[unknown]",
-    })
+    return _render_booking(
+        ctx.confirmation_number or UNKNOWN,
+        ctx.flight_number or UNKNOWN,
+    )
 
 
 # Create agent WITHOUT handoffs - wired in __init__.py to avoid circular imports
 booking_cancellation_agent = Agent[AirlineAgentChatContext](
     name="Booking and Cancellation Agent",
-    model=MODEL,
+    model=get_model(),
     handoff_description="Handles new bookings, rebookings after delays, and cancellations.",
     instructions=booking_cancellation_instructions,
     tools=[cancel_flight, get_matching_flights, book_new_flight],
     handoffs=[],  # Wired in __init__.py
-    input_guardrails=[jailbreak_guardrail, relevance_guardrail],
+    input_guardrails=DEFAULT_INPUT_GUARDRAILS,
 )
@@ -5,9 +5,9 @@ rather than relying on training data.
 """
 from agents import Agent
 
-from ...azure_client import MODEL
+from ...azure_client import get_model
 from ..context import AirlineAgentChatContext
-from ..guardrails import relevance_guardrail, jailbreak_guardrail
+from ..guardrails import DEFAULT_INPUT_GUARDRAILS
 from ..prompts.loader import load_prompt
 from ..tools import faq_lookup_tool
 
@@ -17,10 +17,10 @@ from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 # Create agent WITHOUT handoffs - wired in __init__.py to avoid circular imports
 faq_agent = Agent[AirlineAgentChatContext](
     name="FAQ Agent",
-    model=MODEL,
+    model=get_model(),
     handoff_description="Answers common questions about policies, baggage, seats, and compensation.",
     instructions=load_prompt("faq", {"RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX}),
     tools=[faq_lookup_tool],
     handoffs=[],  # Wired in __init__.py
-    input_guardrails=[jailbreak_guardrail, relevance_guardrail],
+    input_guardrails=DEFAULT_INPUT_GUARDRAILS,
 )
@@ -5,34 +5,38 @@ and proposes alternate flight options when disruptions occur.
 """
 from agents import Agent, RunContextWrapper
 
-from ...azure_client import MODEL
+from ...azure_client import get_model
 from ..context import AirlineAgentChatContext
-from ..guardrails import relevance_guardrail, jailbreak_guardrail
-from ..prompts.loader import load_prompt
+from ..guardrails import DEFAULT_INPUT_GUARDRAILS
+from ..prompts.loader import UNKNOWN, compile_prompt
 from ..tools import flight_status_tool, get_matching_flights
 
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 
 
+_render_flight_info = compile_prompt(
+    "flight_info", {"RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX}, "confirmation", "flight"
+)
+
+
 def flight_information_instructions(
     run_context: RunContextWrapper[AirlineAgentChatContext], agent: Agent[AirlineAgentChatContext]
 ) -> str:
     """Load flight information prompt with context variables."""
     ctx = run_context.context.state
-    return load_prompt("flight_info", {
-        "RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX,
-        "confirmation": ctx.confirmation_number or "[unknown]",
-        "flight": ctx.flight_number or "[unknown]",
-    })
+    return _render_flight_info(
+        ctx.confirmation_number or UNKNOWN,
+        ctx.flight_number or UNKNOWN,
+    )
 
 
 # Create agent WITHOUT handoffs - wired in __init__.py to avoid circular imports
 flight_information_agent = Agent[AirlineAgentChatContext](
     name="Flight Information Agent",
-    model=MODEL,
+    model=get_model(),
     handoff_description="Provides flight status, connection impact, and alternate options.",
     instructions=flight_information_instructions,
     tools=[flight_status_tool, get_matching_flights],
     handoffs=[],  # Wired in __init__.py
-    input_guardrails=[jailbreak_guardrail, relevance_guardrail],
+    input_guardrails=DEFAULT_INPUT_GUARDRAILS,
 )
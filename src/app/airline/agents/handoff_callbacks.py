@@ -3,42 +3,33 @@
 These callbacks run when an agent hands off to another agent,
 ensuring the destination agent has the context data it needs.
 """
-import random
-import string
-
 from agents import RunContextWrapper
 
 from ..context import AirlineAgentChatContext
-from ..demo_data import apply_itinerary_defaults
+from ..demo_data import apply_itinerary_defaults, new_confirmation_number, new_flight_number
 
 
-async def on_seat_booking_handoff(context: RunContextWrapper[AirlineAgentChatContext]) -> None:
+def _hydrate_handoff_context(context: RunContextWrapper[AirlineAgentChatContext]) -> None:
     """
-    Ensure context is hydrated when handing off to the seat and special services agent.
+    Ensure context is hydrated when handing off to booking or seat services.
     
     Generates confirmation number and flight number if not present,
     and applies default itinerary data.
     """
-    apply_itinerary_defaults(context.context.state)
-    if context.context.state.flight_number is None:
-        context.context.state.flight_number = f"FLT-{random.randint(100, 999)}"
-    if context.context.state.confirmation_number is None:
-        context.context.state.confirmation_number = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=6)
-        )
+    state = context.context.state
+    if state.itinerary is None or state.confirmation_number is None or state.flight_number is None:
+        apply_itinerary_defaults(state)
+    if state.confirmation_number is None:
+        state.confirmation_number = new_confirmation_number()
+    if state.flight_number is None:
+        state.flight_number = new_flight_number()
 
 
-async def on_booking_handoff(context: RunContextWrapper[AirlineAgentChatContext]) -> None:
-    """
-    Prepare context when handing off to booking and cancellation.
-    
-    Generates confirmation number and flight number if not present,
-    and applies default itinerary data.
-    """
-    apply_itinerary_defaults(context.context.state)
-    if context.context.state.confirmation_number is None:
-        context.context.state.confirmation_number = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=6)
-        )
-    if context.context.state.flight_number is None:
-        context.context.state.flight_number = f"FLT-{random.randint(100, 999)}"
+def on_seat_booking_handoff(context: RunContextWrapper[AirlineAgentChatContext]) -> None:
+    """Ensure context is hydrated when handing off to the seat and special services agent."""
+    _hydrate_handoff_context(context)
+
+
+def on_booking_handoff(context: RunContextWrapper[AirlineAgentChatContext]) -> None:
+    """Prepare context when handing off to booking and cancellation."""
+    _hydrate_handoff_context(context)
@@ -5,34 +5,41 @@ for customers affected by delays or missed connections.
 """
 from agents import Agent, RunContextWrapper
 
-from ...azure_client import MODEL
+from ...azure_client import get_model
 from ..context import AirlineAgentChatContext
-from ..guardrails import relevance_guardrail, jailbreak_guardrail
-from ..prompts.loader import load_prompt
+from ..guardrails import DEFAULT_INPUT_GUARDRAILS
+from ..prompts.loader import UNKNOWN, compile_prompt
 from ..tools import issue_compensation, faq_lookup_tool
 
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 
 
+# Shown to the model when a context field is not set yet
+_NOT_OPENED = "[not opened]"
+
+_render_refund = compile_prompt(
+    "refund", {"RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX}, "confirmation", "case_id"
+)
+
+
 def refunds_compensation_instructions(
     run_context: RunContextWrapper[AirlineAgentChatContext], agent: Agent[AirlineAgentChatContext]
 ) -> str:
     """Load refunds/compensation prompt with context variables."""
     ctx = run_context.context.state
-    return load_prompt("refund", {
-        "RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX,
-        "confirmation": ctx.confirmation_number or "[unknown]",
-        "case_id": ctx.compensation_case_id or "[not opened]",
-    })
+    return _render_refund(
+        ctx.confirmation_number or UNKNOWN,
+        ctx.compensation_case_id or _NOT_OPENED,
+    )
 
 
 # Create agent WITHOUT handoffs - wired in __init__.py to avoid circular imports
 refunds_compensation_agent = Agent[AirlineAgentChatContext](
     name="Refunds and Compensation Agent",
-    model=MODEL,
+    model=get_model(),
     handoff_description="Opens compensation cases and issues hotel/meal support after delays.",
     instructions=refunds_compensation_instructions,
     tools=[issue_compensation, faq_lookup_tool],
     handoffs=[],  # Wired in __init__.py
-    input_guardrails=[jailbreak_guardrail, relevance_guardrail],
+    input_guardrails=DEFAULT_INPUT_GUARDRAILS,
 )
@@ -2,12 +2,16 @@
 
 This is the entry point agent that all conversations start with.
 It analyzes the customer request and hands off to the appropriate specialist.
+
+Parallel tool calls are enabled so the model can emit get_trip_details and the
+handoff in one response: the SDK runs the tool, then performs the handoff, which
+saves a full model round-trip on the common "hydrate then route" path.
 """
-from agents import Agent
+from agents import Agent, ModelSettings
 
-from ...azure_client import MODEL
+from ...azure_client import get_model
 from ..context import AirlineAgentChatContext
-from ..guardrails import relevance_guardrail, jailbreak_guardrail
+from ..guardrails import DEFAULT_INPUT_GUARDRAILS
 from ..prompts.loader import load_prompt
 from ..tools import get_trip_details
 
@@ -17,10 +21,11 @@ from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 # Create agent WITHOUT handoffs - wired in __init__.py to avoid circular imports
 triage_agent = Agent[AirlineAgentChatContext](
     name="Triage Agent",
-    model=MODEL,
+    model=get_model(),
     handoff_description="Delegates requests to the right specialist agent (flight info, booking, seats, FAQ, baggage, compensation).",
     instructions=load_prompt("triage", {"RECOMMENDED_PROMPT_PREFIX": RECOMMENDED_PROMPT_PREFIX}),
     tools=[get_trip_details],
+    model_settings=ModelSettings(parallel_tool_calls=True),
     handoffs=[],  # Wired in __init__.py
-    input_guardrails=[jailbreak_guardrail, relevance_guardrail],
+    input_guardrails=DEFAULT_INPUT_GUARDRAILS,
 )
@@ -1,12 +1,18 @@
 from __future__ import annotations as _annotations
 
+from collections.abc import Iterable, Mapping
+
 from chatkit.agents import AgentContext
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AirlineAgentContext(BaseModel):
     """Context for airline customer service agents."""
 
+    # Tools write fields directly (state.seat_number = ...); keep assignment free of
+    # validation hooks and ignore unknown keys when rebuilding from stored data.
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     passenger_name: str | None = None
     confirmation_number: str | None = None
     seat_number: str | None = None
@@ -21,6 +27,12 @@ class AirlineAgentContext(BaseModel):
     origin: str | None = None
     destination: str | None = None
 
+    def ensure_itinerary(self, segments: Iterable[Mapping[str, str]]) -> list[dict[str, str]]:
+        """Copy segments into the itinerary if it is still empty; return the itinerary."""
+        if not self.itinerary:
+            self.itinerary = [dict(seg) for seg in segments]
+        return self.itinerary
+
 
 class AirlineAgentChatContext(AgentContext[dict]):
     """
@@ -40,21 +52,16 @@ def create_initial_context() -> AirlineAgentContext:
     return ctx
 
 
+# Internal-only fields never surfaced to the UI
+_HIDDEN = frozenset({"itinerary", "baggage_claim_id", "compensation_case_id", "scenario"})
+
+
 def public_context(ctx: AirlineAgentContext) -> dict:
     """
     Return a filtered view of the context for UI display.
     Hides internal fields like itinerary and baggage_claim_id, and only shows vouchers when granted.
     """
-    data = ctx.model_dump()
-    hidden_keys = {
-        "itinerary",
-        "baggage_claim_id",
-        "compensation_case_id",
-        "scenario",
-    }
-    for key in list(data.keys()):
-        if key in hidden_keys:
-            data.pop(key, None)
+    data = ctx.model_dump(exclude=_HIDDEN)
     # Only surface vouchers once granted
     if not data.get("vouchers"):
         data.pop("vouchers", None)
@@ -1,10 +1,16 @@
 from __future__ import annotations as _annotations
 
-from copy import deepcopy
+import base64
+import os
+import secrets
+import sys
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
 
 from .context import AirlineAgentContext
 
-MOCK_ITINERARIES = {
+_RAW_ITINERARIES = {
     "disrupted": {
         "name": "Paris to New York to Austin",
         "passenger_name": "Morgan Lee",
@@ -79,41 +85,156 @@ MOCK_ITINERARIES = {
     },
 }
 
+# Flight numbers are compared and copied into every context, so share one string object each.
+for _itinerary in _RAW_ITINERARIES.values():
+    for _segment in (*_itinerary["segments"], *_itinerary["rebook_options"]):
+        _segment["flight_number"] = sys.intern(_segment["flight_number"])
+del _itinerary, _segment
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only MappingProxyType views and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Read-only all the way down: callers look data up but must never mutate the shared
+# demo fixtures (segments and rebook options are tuples of read-only mappings).
+MOCK_ITINERARIES: Mapping[str, Mapping[str, Any]] = _freeze(_RAW_ITINERARIES)
+
+
+def _build_flight_indexes() -> tuple[
+    dict[str, tuple[str, Mapping[str, Any]]], dict[str, tuple[Mapping[str, str], bool]]
+]:
+    """
+    Index lowercased flight numbers (segments and rebook options) once at import.
+    
+    Returns (flight -> (scenario_key, itinerary), flight -> (segment, is_rebook_option)).
+    """
+    itineraries: dict[str, tuple[str, Mapping[str, Any]]] = {}
+    segments: dict[str, tuple[Mapping[str, str], bool]] = {}
+    for key, itinerary in MOCK_ITINERARIES.items():
+        for is_rebook, bucket in ((False, "segments"), (True, "rebook_options")):
+            for segment in itinerary.get(bucket, []):
+                flight = segment.get("flight_number", "").lower()
+                # setdefault keeps the first match, same as the original linear scan
+                itineraries.setdefault(flight, (key, itinerary))
+                segments.setdefault(flight, (segment, is_rebook))
+    return itineraries, segments
+
+
+_FLIGHT_INDEX, _SEGMENT_INDEX = _build_flight_indexes()
+
+# Scenario -> ((option, origin_lc, destination_lc), ...): lowercased endpoints for the
+# rebook filter, kept beside the fixtures so the option mappings themselves stay clean.
+_REBOOK_ENDPOINTS: dict[str, tuple[tuple[Mapping[str, str], str, str], ...]] = {
+    key: tuple(
+        (opt, opt.get("origin", "").lower(), opt.get("destination", "").lower())
+        for opt in itinerary.get("rebook_options", ())
+    )
+    for key, itinerary in MOCK_ITINERARIES.items()
+}
+
+# Scenario -> lowercased flight number -> rebook option, for book_new_flight's selection.
+# Built from the reversed options so the first option wins, as the original linear scan did.
+_REBOOK_BY_FLIGHT: dict[str, dict[str, Mapping[str, str]]] = {
+    key: {
+        opt.get("flight_number", "").lower(): opt
+        for opt in reversed(itinerary.get("rebook_options", ()))
+    }
+    for key, itinerary in MOCK_ITINERARIES.items()
+}
+
+
+_urandom = os.urandom
+
+
+def new_confirmation_number() -> str:
+    """Random 6-character confirmation number (base32 alphabet) from one urandom call."""
+    return base64.b32encode(_urandom(4)).decode("ascii")[:6]
+
+
+def new_flight_number() -> str:
+    """Random placeholder flight number in the FLT-100..FLT-999 range."""
+    return f"FLT-{secrets.randbelow(900) + 100}"
+
+
+def clone_segments(segments: Iterable[Mapping[str, str]]) -> list[dict[str, str]]:
+    """Copy itinerary segments for a context; they hold only strings, so shallow dict copies suffice."""
+    return [dict(seg) for seg in segments]
+
 
 def apply_itinerary_defaults(ctx: AirlineAgentContext, scenario_key: str | None = None) -> None:
-    """Populate the context with a demo itinerary if missing."""
+    """
+    Populate the context with a demo itinerary if missing.
+    
+    Afterwards flight_number is never None (every demo itinerary has segments), so tools
+    that call this first need no check of their own.
+    """
     target_key = scenario_key or ctx.scenario or "disrupted"
     data = MOCK_ITINERARIES.get(target_key) or next(iter(MOCK_ITINERARIES.values()))
-    ctx.scenario = target_key
-    ctx.passenger_name = ctx.passenger_name or data.get("passenger_name")
-    ctx.confirmation_number = ctx.confirmation_number or data.get("confirmation_number")
     segments = data.get("segments", [])
+    # Write a field only when it actually changes: every assignment goes through
+    # BaseModel.__setattr__, and on repeat handoffs most fields are already set.
+    if ctx.scenario != target_key:
+        ctx.scenario = target_key
+    if not ctx.passenger_name:
+        ctx.passenger_name = data.get("passenger_name")
+    if not ctx.confirmation_number:
+        ctx.confirmation_number = data.get("confirmation_number")
     if ctx.flight_number is None and segments:
         ctx.flight_number = segments[0].get("flight_number")
-    ctx.seat_number = ctx.seat_number or data.get("seat_number")
+    if not ctx.seat_number:
+        ctx.seat_number = data.get("seat_number")
     if ctx.itinerary is None:
-        ctx.itinerary = deepcopy(segments)
+        ctx.itinerary = clone_segments(segments)
     # Set trip endpoints for display without exposing the full itinerary
     if segments:
-        ctx.origin = ctx.origin or segments[0].get("origin")
-        ctx.destination = ctx.destination or segments[-1].get("destination")
+        if not ctx.origin:
+            ctx.origin = segments[0].get("origin")
+        if not ctx.destination:
+            ctx.destination = segments[-1].get("destination")
 
 
-def get_itinerary_for_flight(flight_number: str | None) -> tuple[str, dict] | None:
+def get_itinerary_for_flight(flight_number: str | None) -> tuple[str, Mapping[str, Any]] | None:
     """Return (scenario_key, itinerary) if the flight is present in a mock itinerary."""
     if not flight_number:
         return None
-    for key, itinerary in MOCK_ITINERARIES.items():
-        for segment in itinerary.get("segments", []):
-            if segment.get("flight_number", "").lower() == flight_number.lower():
-                return key, itinerary
-        for segment in itinerary.get("rebook_options", []):
-            if segment.get("flight_number", "").lower() == flight_number.lower():
-                return key, itinerary
-    return None
+    return _FLIGHT_INDEX.get(flight_number.lower())
+
+
+def get_flight_segment(flight_number: str | None) -> tuple[Mapping[str, str], bool] | None:
+    """Return (segment, is_rebook_option) for a flight in a mock itinerary."""
+    if not flight_number:
+        return None
+    return _SEGMENT_INDEX.get(flight_number.lower())
+
+
+def find_rebook_option(scenario_key: str, flight_number: str | None) -> Mapping[str, str] | None:
+    """Return the scenario's rebook option for a flight number (case-insensitive), if any."""
+    if not flight_number:
+        return None
+    return _REBOOK_BY_FLIGHT.get(scenario_key, {}).get(flight_number.lower())
+
+
+def match_rebook_options(
+    scenario_key: str, origin: str | None = None, destination: str | None = None
+) -> list[Mapping[str, str]]:
+    """Rebook options whose endpoints contain the given origin/destination (case-insensitive)."""
+    origin_lc = origin.lower() if origin is not None else None
+    destination_lc = destination.lower() if destination is not None else None
+    return [
+        opt
+        for opt, opt_origin, opt_destination in _REBOOK_ENDPOINTS.get(scenario_key, ())
+        if (origin_lc is None or origin_lc in opt_origin)
+        and (destination_lc is None or destination_lc in opt_destination)
+    ]
 
 
-def active_itinerary(ctx: AirlineAgentContext) -> tuple[str, dict]:
+def active_itinerary(ctx: AirlineAgentContext) -> tuple[str, Mapping[str, Any]]:
     """Resolve the active itinerary for the current context."""
     if ctx.scenario and ctx.scenario in MOCK_ITINERARIES:
         return ctx.scenario, MOCK_ITINERARIES[ctx.scenario]
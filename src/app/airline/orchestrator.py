@@ -4,7 +4,8 @@ Orchestrator - Agent execution pipeline.
 This is the WORKSHOP ENTRY POINT for debugging agent orchestration.
 Set a breakpoint at Orchestrator.run() to step through the entire flow:
 
-    1. Triage agent receives user message
+    1. Triage agent receives user message (unambiguous first messages are
+       pre-routed straight to a specialist; see _fast_route)
     2. Triage decides which specialist to hand off to
     3. Handoff callback hydrates context
     4. Specialist agent executes (calls tools)
@@ -16,10 +17,12 @@ DEBUGGING:
     Set breakpoint at Orchestrator.run() 
     Step through to see: handoffs, tool calls, agent responses
 """
-from dataclasses import dataclass
-from typing import Any, AsyncIterator
+import re
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Callable
 
-from agents import Agent, Runner
+from agents import Agent, AgentHooks, RunContextWrapper, Runner
+from agents.run_context import AgentHookContext
 from agents.run import RunResultStreaming
 from chatkit.agents import stream_agent_response
 
@@ -31,10 +34,143 @@ from .agents import (
     flight_information_agent,
     booking_cancellation_agent,
     refunds_compensation_agent,
+    on_booking_handoff,
+    on_seat_booking_handoff,
 )
+from .tools.flight_tools import hydrate_trip_from_message
 
+# Built once at import; every Orchestrator shares this name -> agent mapping.
+_AGENT_REGISTRY: dict[str, Agent[AirlineAgentChatContext]] = {
+    agent.name: agent
+    for agent in (
+        triage_agent,
+        faq_agent,
+        seat_special_services_agent,
+        flight_information_agent,
+        booking_cancellation_agent,
+        refunds_compensation_agent,
+    )
+}
 
-@dataclass
+# Deterministic pre-router: unambiguous first-turn intents skip the triage model call.
+# Each pattern is a multi-word request phrase, not a topic keyword, so questions that merely
+# mention a seat or a status ("How many seats are on the plane?", "status match program")
+# go to triage. A message is pre-routed only when every matching pattern points at the same
+# agent; mixed intents ("cancel my flight and refund me") fall through to triage too.
+_FAST_ROUTES: tuple[tuple[re.Pattern[str], Agent[AirlineAgentChatContext]], ...] = (
+    (
+        re.compile(r"\b(?:cancel (?:my|the|this) (?:flight|booking|reservation|trip)|rebook (?:me|my))\b", re.IGNORECASE),
+        booking_cancellation_agent,
+    ),
+    (
+        re.compile(
+            r"\b(?:(?:get|want|need|request) (?:a |my )?refund|refund (?:my|for)"
+            r"|(?:claim|request|get) compensation|compensation for)\b",
+            re.IGNORECASE,
+        ),
+        refunds_compensation_agent,
+    ),
+    (
+        re.compile(
+            r"\b(?:(?:change|move|switch|swap) (?:me to |my )?(?:a )?seat|seat (?:change|map|assignment|selection)"
+            r"|(?:pick|choose|select) (?:a |my )?seat)\b",
+            re.IGNORECASE,
+        ),
+        seat_special_services_agent,
+    ),
+    (
+        re.compile(
+            r"\b(?:status of (?:my |the )?flight|flight status|missed (?:my )?connect(?:ion|ing flight)"
+            r"|my flight (?:is|was) delayed|is my flight (?:on time|delayed))\b",
+            re.IGNORECASE,
+        ),
+        flight_information_agent,
+    ),
+    (
+        re.compile(r"\b(?:bag(?:gage)? (?:policy|allowance|fees?)|carry-on (?:policy|allowance)|checked bag fees?)\b", re.IGNORECASE),
+        faq_agent,
+    ),
+)
+
+
+def _hydrate_booking(context: AirlineAgentChatContext, text: str) -> None:
+    """Same prep as triage's handoff to booking (its on_handoff callback)."""
+    on_booking_handoff(RunContextWrapper(context=context))
+
+
+def _hydrate_seat_booking(context: AirlineAgentChatContext, text: str) -> None:
+    """Same prep as triage's handoff to seat services (its on_handoff callback)."""
+    on_seat_booking_handoff(RunContextWrapper(context=context))
+
+
+def _hydrate_flight_info(context: AirlineAgentChatContext, text: str) -> None:
+    """Load the itinerary triage's get_trip_details would have, when none is loaded yet."""
+    if context.state.itinerary is None:
+        hydrate_trip_from_message(context.state, text)
+
+
+# A fast route skips triage, so it must do the prep triage would have: its handoffs to
+# booking and seats hydrate the context, and for flight questions ("I missed my connection
+# from Paris") it calls get_trip_details first.
+_FAST_ROUTE_HYDRATION: dict[str, Callable[[AirlineAgentChatContext, str], None]] = {
+    booking_cancellation_agent.name: _hydrate_booking,
+    seat_special_services_agent.name: _hydrate_seat_booking,
+    flight_information_agent.name: _hydrate_flight_info,
+}
+
+
+class _HydrateOnStart(AgentHooks[AirlineAgentChatContext]):
+    """Runs a fast route's hydration when its agent starts, i.e. after blocking guardrails pass."""
+
+    def __init__(self, hydrate: Callable[[AirlineAgentChatContext, str], None]) -> None:
+        self._hydrate = hydrate
+
+    async def on_start(self, context: AgentHookContext[AirlineAgentChatContext], agent: Agent) -> None:
+        self._hydrate(context.context, _last_user_text(context.turn_input))
+
+
+def _prerouted(agent: Agent[AirlineAgentChatContext]) -> Agent[AirlineAgentChatContext]:
+    """
+    Copy of a hydrating specialist for pre-routed turns.
+
+    The Runner normally runs input guardrails alongside the first model call. Here they run
+    first instead (run_in_parallel=False) and the hydration moves into on_start, which the
+    Runner only reaches once they pass, so a rejected message never touches the context.
+    """
+    return agent.clone(
+        input_guardrails=[replace(g, run_in_parallel=False) for g in agent.input_guardrails],
+        hooks=_HydrateOnStart(_FAST_ROUTE_HYDRATION[agent.name]),
+    )
+
+
+# Built once at import, like _AGENT_REGISTRY; handoffs still target the registry agents.
+_PREROUTED_AGENTS: dict[str, Agent[AirlineAgentChatContext]] = {
+    name: _prerouted(_AGENT_REGISTRY[name]) for name in _FAST_ROUTE_HYDRATION
+}
+
+
+def _last_user_text(input_items: list[Any]) -> str:
+    """Text of the final input item if it is a user message, else an empty string."""
+    if not input_items or input_items[-1].get("role") != "user":
+        return ""
+    content = input_items[-1].get("content")
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content if isinstance(content, str) else ""
+
+
+def _fast_route(text: str) -> Agent[AirlineAgentChatContext] | None:
+    """Return the specialist for an unambiguous intent, or None to let triage decide."""
+    matched = None
+    for pattern, agent in _FAST_ROUTES:
+        if pattern.search(text):
+            if matched is not None and matched is not agent:
+                return None
+            matched = agent
+    return matched
+
+
+@dataclass(slots=True, frozen=True)
 class OrchestrationResult:
     """Result container returned after orchestration completes."""
     result: RunResultStreaming
@@ -51,7 +187,7 @@ class Orchestrator:
     Usage:
         orchestrator = Orchestrator()
         event_stream, result = await orchestrator.run(agent_name, input_items, context)
-        async for event, _ in event_stream:
+        async for event in event_stream:
             # Process events
     
     For Testing:
@@ -66,14 +202,7 @@ class Orchestrator:
             starting_agent: Override the default triage agent (useful for testing)
         """
         self._starting_agent = starting_agent or triage_agent
-        self._agents: dict[str, Agent[AirlineAgentChatContext]] = {
-            triage_agent.name: triage_agent,
-            faq_agent.name: faq_agent,
-            seat_special_services_agent.name: seat_special_services_agent,
-            flight_information_agent.name: flight_information_agent,
-            booking_cancellation_agent.name: booking_cancellation_agent,
-            refunds_compensation_agent.name: refunds_compensation_agent,
-        }
+        self._agents = _AGENT_REGISTRY
     
     @property
     def starting_agent(self) -> Agent[AirlineAgentChatContext]:
@@ -97,12 +226,43 @@ class Orchestrator:
         """
         return self._agents.get(name, self._starting_agent)
     
+    def route(
+        self,
+        agent: Agent[AirlineAgentChatContext] | str,
+        input_items: list[dict[str, Any]],
+    ) -> Agent[AirlineAgentChatContext]:
+        """
+        Resolve the agent that should take this turn.
+        
+        The first turn of a conversation is pre-routed straight to a specialist when the
+        user's message has one unambiguous intent (see _fast_route). The specialist then
+        does the prep triage would have, once the input guardrail has passed (see
+        _prerouted). Later turns stay with the current agent, triage included.
+        
+        Args:
+            agent: The current agent (instance or name string)
+            input_items: Conversation history as input list
+        
+        Returns:
+            The Agent instance to run
+        """
+        # Resolve agent name to instance if string provided (exact type check;
+        # callers almost always pass an Agent instance)
+        if type(agent) is str:
+            agent = self.get_agent(agent)
+        if agent is not self._starting_agent or len(input_items) != 1:
+            return agent
+        routed = _fast_route(_last_user_text(input_items))
+        if routed is None:
+            return agent
+        return _PREROUTED_AGENTS.get(routed.name, routed)
+    
     async def run(
         self,
         agent: Agent[AirlineAgentChatContext] | str,
         input_items: list[dict[str, Any]],
         context: AirlineAgentChatContext,
-    ) -> tuple[AsyncIterator[tuple[Any, RunResultStreaming]], RunResultStreaming]:
+    ) -> tuple[AsyncIterator[Any], RunResultStreaming]:
         """
         Execute the agent orchestration pipeline.
         
@@ -120,7 +280,8 @@ class Orchestrator:
         
         Returns:
             Tuple of (event_stream, result) where:
-            - event_stream: AsyncIterator yielding SDK events
+            - event_stream: AsyncIterator yielding SDK events (handoff, tool call,
+              message chunk, etc.) straight from stream_agent_response
             - result: The RunResultStreaming object for post-processing
         
         Debug Flow:
@@ -138,9 +299,7 @@ class Orchestrator:
             > Event: message "Here's the seat map..."
             > Orchestration complete, return to caller
         """
-        # Resolve agent name to instance if string provided
-        if isinstance(agent, str):
-            agent = self.get_agent(agent)
+        agent = self.route(agent, input_items)
         
         # ==========================================================
         # ORCHESTRATION ENTRY POINT
@@ -153,16 +312,9 @@ class Orchestrator:
             context=context,
         )
         
-        async def event_stream() -> AsyncIterator[tuple[Any, RunResultStreaming]]:
-            """
-            Stream events from the agent pipeline.
-            Each iteration yields one event: handoff, tool call, message chunk, etc.
-            """
-            async for event in stream_agent_response(context, result):
-                # Yield event + result so caller can access new_items
-                yield event, result
-        
-        return event_stream(), result
+        # Hand back ChatKit's stream as-is: no wrapper generator frame or per-event
+        # tuple; callers already get `result` for new_items.
+        return stream_agent_response(context, result), result
 
 
 # ==========================================================
@@ -172,11 +324,14 @@ class Orchestrator:
 # imports get_agent_by_name or run_conversation directly.
 # New code should use the Orchestrator class directly.
 
+# Shared instance so the wrappers don't construct an Orchestrator per call.
+_default_orchestrator = Orchestrator()
+
 def get_agent_by_name(name: str) -> Agent[AirlineAgentChatContext]:
     """Backward compatibility wrapper. Use Orchestrator.get_agent instead."""
-    return Orchestrator().get_agent(name)
+    return _default_orchestrator.get_agent(name)
 
 
 def run_conversation(agent, input_items, context=None):
     """Backward compatibility wrapper. Use Orchestrator.run instead."""
-    return Orchestrator().run(agent, input_items, context=context)
+    return _default_orchestrator.run(agent, input_items, context=context)
@@ -5,6 +5,9 @@ Prompts are stored as plain text files with {placeholder} syntax for variable su
 This decouples prompt content from Python code, making it easy for workshop attendees
 to modify prompts without touching agent implementation.
 
+Templates are read and split into literal/placeholder fragments once per process
+(restart the server to pick up prompt edits). Rendering only joins fragments.
+
 Usage:
     from ..prompts.loader import load_prompt
     
@@ -13,13 +16,113 @@ Usage:
             "customer_name": ctx.customer_name,
             "flight": ctx.flight_number,
         })
+
+    # Or bake constant variables in once at import time:
+    _TEMPLATE = load_template("my_agent").partial({"RECOMMENDED_PROMPT_PREFIX": PREFIX})
+    _TEMPLATE.render({"flight": ctx.flight_number})
+
+    # Or, for per-turn agent instructions, a cached positional renderer:
+    _render = compile_prompt("my_agent", {"RECOMMENDED_PROMPT_PREFIX": PREFIX}, "flight")
+    _render(ctx.flight_number or UNKNOWN)
 """
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
 PROMPTS_DIR = Path(__file__).parent
 
+# Shown to the model in place of a context field that is not set yet
+UNKNOWN = "[unknown]"
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+class PromptTemplate:
+    """
+    A prompt template pre-split into literal text and {placeholder} fragments.
+    
+    Placeholders without a value are left in the output verbatim, matching the
+    original str.replace based substitution.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self, fragments: tuple[tuple[str, str | None], ...]) -> None:
+        # Each fragment is (literal_text, placeholder_name_or_None)
+        self._fragments = fragments
+
+    @classmethod
+    def parse(cls, text: str) -> "PromptTemplate":
+        """Split raw template text into fragments."""
+        fragments: list[tuple[str, str | None]] = []
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(text):
+            fragments.append((text[pos:match.start()], match.group(1)))
+            pos = match.end()
+        fragments.append((text[pos:], None))
+        return cls(tuple(fragments))
+
+    def partial(self, variables: dict[str, Any]) -> "PromptTemplate":
+        """Return a new template with the given variables substituted permanently."""
+        fragments: list[tuple[str, str | None]] = []
+        literal = ""
+        for text, name in self._fragments:
+            literal += text
+            if name is not None and name in variables:
+                literal += str(variables[name])
+            elif name is not None:
+                fragments.append((literal, name))
+                literal = ""
+        fragments.append((literal, None))
+        return PromptTemplate(tuple(fragments))
+
+    def as_format(self, *names: str) -> str:
+        """
+        Return a printf-style format string with one positional %s per placeholder.
+        
+        The template's remaining placeholders must be exactly ``names`` in order;
+        literal '%' characters are escaped. Use for hot paths: ``fmt % (a, b)``.
+        
+        Raises:
+            ValueError: If the placeholders don't match ``names``.
+        """
+        placeholders = tuple(name for _, name in self._fragments if name is not None)
+        if placeholders != names:
+            raise ValueError(f"Template placeholders {placeholders} do not match {names}")
+        return "".join(
+            text.replace("%", "%%") + ("%s" if name is not None else "")
+            for text, name in self._fragments
+        )
+
+    def render(self, variables: dict[str, Any] | None = None) -> str:
+        """Substitute variables and return the final prompt string."""
+        variables = variables or {}
+        parts: list[str] = []
+        for text, name in self._fragments:
+            parts.append(text)
+            if name is not None:
+                parts.append(str(variables[name]) if name in variables else f"{{{name}}}")
+        return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def load_template(agent_name: str) -> PromptTemplate:
+    """
+    Read and pre-split a prompt template. Cached for the life of the process.
+    
+    Raises:
+        FileNotFoundError: If the prompt template file doesn't exist.
+    """
+    template_path = PROMPTS_DIR / f"{agent_name}.txt"
+    if not template_path.exists():
+        raise FileNotFoundError(
+            f"Prompt template not found: {template_path}. "
+            f"Available prompts: {list_available_prompts()}"
+        )
+    return PromptTemplate.parse(template_path.read_text(encoding="utf-8"))
+
 
 def load_prompt(agent_name: str, variables: dict[str, Any] | None = None) -> str:
     """
@@ -41,20 +144,31 @@ def load_prompt(agent_name: str, variables: dict[str, Any] | None = None) -> str
         load_prompt("greeting", {"name": "John", "flight": "PA441"})
         Returns: "Hello John, your flight PA441 is ready."
     """
-    template_path = PROMPTS_DIR / f"{agent_name}.txt"
-    if not template_path.exists():
-        raise FileNotFoundError(
-            f"Prompt template not found: {template_path}. "
-            f"Available prompts: {list_available_prompts()}"
-        )
-    
-    template = template_path.read_text(encoding="utf-8")
+    return load_template(agent_name).render(variables)
+
+
+def compile_prompt(
+    agent_name: str, constants: dict[str, Any], *names: str, cache_size: int = 256
+) -> Callable[..., str]:
+    """
+    Build a renderer for an agent's per-turn instructions.
     
-    if variables:
-        for key, value in variables.items():
-            template = template.replace(f"{{{key}}}", str(value))
+    The template is loaded with ``constants`` baked in and flattened to a %-format
+    string (see PromptTemplate.as_format). The returned function takes the values for
+    ``names`` positionally and caches its output per distinct set of values.
+    Instructions are rendered on every turn but depend on only a few context fields.
     
-    return template
+    Raises:
+        FileNotFoundError: If the prompt template file doesn't exist.
+        ValueError: If the remaining placeholders don't match ``names``.
+    """
+    fmt = load_template(agent_name).partial(constants).as_format(*names)
+
+    @lru_cache(maxsize=cache_size)
+    def render(*values: str) -> str:
+        return fmt % values
+
+    return render
 
 
 def list_available_prompts() -> list[str]:
@@ -8,8 +8,19 @@ See: docs/REFACTOR-PLAN.md - Exercise 2: Add Baggage Agent
 """
 from __future__ import annotations as _annotations
 
+import re
+
 from agents import function_tool
 
+# Single case-insensitive pass; answer priority follows _BAGGAGE_ORDER (fee first, as before).
+_BAGGAGE_RE = re.compile(r"(?P<fee>fee)|(?P<allowance>allowance)|(?P<missing>missing|lost)", re.IGNORECASE)
+_BAGGAGE_ORDER = ("fee", "allowance", "missing")
+_BAGGAGE_ANSWERS = {
+    "fee": "Overweight bag fee is $75.",
+    "allowance": "One carry-on and one checked bag (up to 50 lbs) are included.",
+    "missing": "If a bag is missing, file a baggage claim at the airport or with the Baggage Agent so we can track and deliver it.",
+}
+
 
 @function_tool(
     name_override="baggage_tool",
@@ -17,11 +28,8 @@ from agents import function_tool
 )
 async def baggage_tool(query: str) -> str:
     """Lookup baggage allowance and fees."""
-    q = query.lower()
-    if "fee" in q:
-        return "Overweight bag fee is $75."
-    if "allowance" in q:
-        return "One carry-on and one checked bag (up to 50 lbs) are included."
-    if "missing" in q or "lost" in q:
-        return "If a bag is missing, file a baggage claim at the airport or with the Baggage Agent so we can track and deliver it."
+    topics = {match.lastgroup for match in _BAGGAGE_RE.finditer(query)}
+    for topic in _BAGGAGE_ORDER:
+        if topic in topics:
+            return _BAGGAGE_ANSWERS[topic]
     return "Please provide details about your baggage inquiry."
@@ -1,15 +1,16 @@
 """Booking domain tools - New bookings, rebookings, cancellations."""
 from __future__ import annotations as _annotations
 
-import random
-import string
-from copy import deepcopy
-
 from agents import RunContextWrapper, function_tool
 from chatkit.types import ProgressUpdateEvent
 
 from ..context import AirlineAgentChatContext
-from ..demo_data import active_itinerary, apply_itinerary_defaults
+from ..demo_data import (
+    active_itinerary,
+    apply_itinerary_defaults,
+    find_rebook_option,
+    new_confirmation_number,
+)
 
 
 @function_tool(
@@ -25,19 +26,12 @@ async def book_new_flight(
     scenario_key, itinerary = active_itinerary(ctx_state)
     apply_itinerary_defaults(ctx_state, scenario_key=scenario_key)
     options = itinerary.get("rebook_options", [])
-    selection = None
-    if flight_number:
-        selection = next(
-            (opt for opt in options if opt.get("flight_number", "").lower() == flight_number.lower()),
-            None,
-        )
+    selection = find_rebook_option(scenario_key, flight_number)
     if selection is None and options:
         selection = options[0]
     if selection is None:
         seat = ctx_state.seat_number or "auto-assign"
-        confirmation = ctx_state.confirmation_number or "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=6)
-        )
+        confirmation = ctx_state.confirmation_number or new_confirmation_number()
         ctx_state.confirmation_number = confirmation
         await context.context.stream(ProgressUpdateEvent(text="Booked placeholder flight"))
         return (
@@ -46,10 +40,9 @@ async def book_new_flight(
         )
     ctx_state.flight_number = selection.get("flight_number")
     ctx_state.seat_number = selection.get("seat") or ctx_state.seat_number or "auto-assign"
-    ctx_state.itinerary = ctx_state.itinerary or deepcopy(itinerary.get("segments", []))
     updated_itinerary = [
         seg
-        for seg in ctx_state.itinerary
+        for seg in ctx_state.ensure_itinerary(itinerary.get("segments", []))
         if not (
             scenario_key == "disrupted"
             and seg.get("origin", "").startswith("New York")
@@ -68,9 +61,7 @@ async def book_new_flight(
         }
     )
     ctx_state.itinerary = updated_itinerary
-    confirmation = ctx_state.confirmation_number or "".join(
-        random.choices(string.ascii_uppercase + string.digits, k=6)
-    )
+    confirmation = ctx_state.confirmation_number or new_confirmation_number()
     ctx_state.confirmation_number = confirmation
     await context.context.stream(
         ProgressUpdateEvent(
@@ -94,9 +85,6 @@ async def cancel_flight(
     """Cancel the flight in the context."""
     apply_itinerary_defaults(context.context.state)
     fn = context.context.state.flight_number
-    assert fn is not None, "Flight number is required"
-    confirmation = context.context.state.confirmation_number or "".join(
-        random.choices(string.ascii_uppercase + string.digits, k=6)
-    )
+    confirmation = context.context.state.confirmation_number or new_confirmation_number()
     context.context.state.confirmation_number = confirmation
     return f"Flight {fn} successfully cancelled for confirmation {confirmation}"
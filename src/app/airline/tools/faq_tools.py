@@ -1,34 +1,64 @@
 """FAQ domain tools - Policy and information lookup."""
 from __future__ import annotations as _annotations
 
+import re
+
 from agents import function_tool
 
+# Topic -> surface keywords, in answer priority order. Keywords are substring matches,
+# as before ("airplane" mentions the plane). Adding a topic is a table entry plus an answer.
+_FAQ_TOPICS: dict[str, tuple[str, ...]] = {
+    "baggage": ("bag",),
+    "compensation": ("compensation", "delay", "voucher"),
+    "seats": ("seats", "plane"),
+    "wifi": ("wifi",),
+}
+# One case-insensitive pass finds every topic mentioned (one named group per topic)
+_FAQ_RE = re.compile(
+    "|".join(
+        f"(?P<{topic}>{'|'.join(map(re.escape, keywords))})" for topic, keywords in _FAQ_TOPICS.items()
+    ),
+    re.IGNORECASE,
+)
+# First letters (either case) of every keyword: a question containing none of them cannot
+# match, so it skips the regex scan entirely.
+_FAQ_FIRST_CHARS = frozenset(
+    char
+    for keywords in _FAQ_TOPICS.values()
+    for keyword in keywords
+    for char in (keyword[0].lower(), keyword[0].upper())
+)
+_FAQ_DEFAULT = "I'm sorry, I don't know the answer to that question."
+_FAQ_ANSWERS = {
+    "baggage": (
+        "You are allowed to bring one bag on the plane. "
+        "It must be under 50 pounds and 22 inches x 14 inches x 9 inches. "
+        "If a bag is delayed or missing, file a baggage claim and we will track it for delivery."
+    ),
+    "compensation": (
+        "For lengthy delays we provide duty-of-care: hotel and meal vouchers plus ground transport where needed. "
+        "If the delay is over 3 hours or causes a missed connection, we also open a compensation case and can offer miles or travel credit. "
+        "A Refunds & Compensation agent can submit the case and share the voucher details with you."
+    ),
+    "seats": (
+        "There are 120 seats on the plane. "
+        "There are 22 business class seats and 98 economy seats. "
+        "Exit rows are rows 4 and 16. "
+        "Rows 5-8 are Economy Plus, with extra legroom."
+    ),
+    "wifi": "We have free wifi on the plane, join Airline-Wifi",
+}
+
 
 @function_tool(
     name_override="faq_lookup_tool", description_override="Lookup frequently asked questions."
 )
 async def faq_lookup_tool(question: str) -> str:
     """Lookup answers to frequently asked questions."""
-    q = question.lower()
-    if "bag" in q or "baggage" in q:
-        return (
-            "You are allowed to bring one bag on the plane. "
-            "It must be under 50 pounds and 22 inches x 14 inches x 9 inches. "
-            "If a bag is delayed or missing, file a baggage claim and we will track it for delivery."
-        )
-    if "compensation" in q or "delay" in q or "voucher" in q:
-        return (
-            "For lengthy delays we provide duty-of-care: hotel and meal vouchers plus ground transport where needed. "
-            "If the delay is over 3 hours or causes a missed connection, we also open a compensation case and can offer miles or travel credit. "
-            "A Refunds & Compensation agent can submit the case and share the voucher details with you."
-        )
-    elif "seats" in q or "plane" in q:
-        return (
-            "There are 120 seats on the plane. "
-            "There are 22 business class seats and 98 economy seats. "
-            "Exit rows are rows 4 and 16. "
-            "Rows 5-8 are Economy Plus, with extra legroom."
-        )
-    elif "wifi" in q:
-        return "We have free wifi on the plane, join Airline-Wifi"
-    return "I'm sorry, I don't know the answer to that question."
+    if _FAQ_FIRST_CHARS.isdisjoint(question):
+        return _FAQ_DEFAULT
+    topics = {match.lastgroup for match in _FAQ_RE.finditer(question)}
+    for topic in _FAQ_TOPICS:
+        if topic in topics:
+            return _FAQ_ANSWERS[topic]
+    return _FAQ_DEFAULT
@@ -1,13 +1,37 @@
 """Flight domain tools - Status, matching flights, trip details."""
 from __future__ import annotations as _annotations
 
-from copy import deepcopy
+import re
 
 from agents import RunContextWrapper, function_tool
 from chatkit.types import ProgressUpdateEvent
 
-from ..context import AirlineAgentChatContext
-from ..demo_data import active_itinerary, apply_itinerary_defaults, get_itinerary_for_flight
+from ..context import AirlineAgentChatContext, AirlineAgentContext
+from ..demo_data import (
+    active_itinerary,
+    apply_itinerary_defaults,
+    get_flight_segment,
+    get_itinerary_for_flight,
+    match_rebook_options,
+)
+
+# Cities on the disrupted Paris -> New York -> Austin trip (word-bounded, so "comparison" is not Paris)
+_TRIP_RE = re.compile(r"\b(?:paris|new york|austin)\b", re.IGNORECASE)
+
+
+def hydrate_trip_from_message(ctx: AirlineAgentContext, message: str) -> str:
+    """
+    Hydrate the mock itinerary a message points at and return its scenario key.
+
+    Shared by get_trip_details and the orchestrator's pre-route to flight information,
+    which skips triage and so must load the same itinerary triage would have.
+    """
+    scenario_key = "disrupted" if _TRIP_RE.search(message) else "on_time"
+    apply_itinerary_defaults(ctx, scenario_key=scenario_key)
+    if scenario_key == "disrupted":
+        ctx.origin = ctx.origin or "Paris (CDG)"
+        ctx.destination = ctx.destination or "Austin (AUS)"
+    return scenario_key
 
 
 @function_tool(
@@ -21,22 +45,13 @@ async def get_trip_details(
     If the user mentions Paris, New York, or Austin, hydrate the context with the disrupted mock itinerary.
     Otherwise, hydrate the on-time mock itinerary. Returns the detected flight and confirmation.
     """
-    text = message.lower()
-    keywords = ["paris", "new york", "austin"]
-    scenario_key = "disrupted" if any(k in text for k in keywords) else "on_time"
-    apply_itinerary_defaults(context.context.state, scenario_key=scenario_key)
+    scenario_key = hydrate_trip_from_message(context.context.state, message)
     ctx = context.context.state
-    if scenario_key == "disrupted":
-        ctx.origin = ctx.origin or "Paris (CDG)"
-        ctx.destination = ctx.destination or "Austin (AUS)"
-    segments = ctx.itinerary or []
-    segment_summaries = []
-    for seg in segments:
-        segment_summaries.append(
-            f"{seg.get('flight_number')} {seg.get('origin')} -> {seg.get('destination')} "
-            f"status: {seg.get('status')}"
-        )
-    summary = "; ".join(segment_summaries) if segment_summaries else "No segment details available"
+    summary = "; ".join(
+        f"{seg.get('flight_number')} {seg.get('origin')} -> {seg.get('destination')} "
+        f"status: {seg.get('status')}"
+        for seg in ctx.itinerary or []
+    ) or "No segment details available"
     return (
         f"Hydrated {scenario_key} itinerary: flight {ctx.flight_number}, confirmation "
         f"{ctx.confirmation_number}, origin {ctx.origin}, destination {ctx.destination}. {summary}"
@@ -56,15 +71,10 @@ async def flight_status_tool(
     ctx_state.flight_number = flight_number
     match = get_itinerary_for_flight(flight_number)
     if match:
-        scenario_key, itinerary = match
+        scenario_key = match[0]
         apply_itinerary_defaults(ctx_state, scenario_key=scenario_key)
-        segments = itinerary.get("segments", [])
-        rebook_options = itinerary.get("rebook_options", [])
-        segment = next(
-            (seg for seg in segments if seg.get("flight_number", "").lower() == flight_number.lower()),
-            None,
-        )
-        if segment:
+        segment, is_rebook_option = get_flight_segment(flight_number)
+        if not is_rebook_option:
             route = f"{segment.get('origin', 'Unknown')} to {segment.get('destination', 'Unknown')}"
             details = [
                 f"Flight {flight_number} ({route})",
@@ -80,24 +90,16 @@ async def flight_status_tool(
                 ProgressUpdateEvent(text=f"Found status for flight {flight_number}")
             )
             return " | ".join(details)
-        replacement = next(
-            (
-                seg
-                for seg in rebook_options
-                if seg.get("flight_number", "").lower() == flight_number.lower()
-            ),
-            None,
+        # Otherwise the flight is one of the itinerary's rebook options
+        route = f"{segment.get('origin', 'Unknown')} to {segment.get('destination', 'Unknown')}"
+        seat = segment.get("seat", "auto-assign")
+        await context.context.stream(
+            ProgressUpdateEvent(text=f"Found alternate flight {flight_number}")
+        )
+        return (
+            f"Replacement flight {flight_number} ({route}) is available. "
+            f"Departure {segment.get('departure')} arriving {segment.get('arrival')}. Seat {seat} held."
         )
-        if replacement:
-            route = f"{replacement.get('origin', 'Unknown')} to {replacement.get('destination', 'Unknown')}"
-            seat = replacement.get("seat", "auto-assign")
-            await context.context.stream(
-                ProgressUpdateEvent(text=f"Found alternate flight {flight_number}")
-            )
-            return (
-                f"Replacement flight {flight_number} ({route}) is available. "
-                f"Departure {replacement.get('departure')} arriving {replacement.get('arrival')}. Seat {seat} held."
-            )
     await context.context.stream(ProgressUpdateEvent(text=f"No disruptions found for {flight_number}"))
     return f"Flight {flight_number} is on time and scheduled to depart at gate A10."
 
@@ -120,13 +122,8 @@ async def get_matching_flights(
     if not options:
         await context.context.stream(ProgressUpdateEvent(text="No alternates needed — trip on time"))
         return "All flights are operating on time. No alternate flights are needed."
-    filtered = [
-        opt
-        for opt in options
-        if (origin is None or origin.lower() in opt.get("origin", "").lower())
-        and (destination is None or destination.lower() in opt.get("destination", "").lower())
-    ]
-    final_options = filtered or options
+    # demo_data keeps pre-lowercased endpoints, so only the filters are lowercased per call
+    final_options = match_rebook_options(scenario_key, origin, destination) or options
     await context.context.stream(
         ProgressUpdateEvent(text=f"Found {len(final_options)} matching flight option(s)")
     )
@@ -138,5 +135,5 @@ async def get_matching_flights(
         )
     if scenario_key == "disrupted":
         lines.append("These options arrive in Austin the next day. Overnight hotel and meals are covered.")
-    ctx_state.itinerary = ctx_state.itinerary or deepcopy(itinerary.get("segments", []))
+    ctx_state.ensure_itinerary(itinerary.get("segments", []))
     return "Matching flights:\n" + "\n".join(lines)
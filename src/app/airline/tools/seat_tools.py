@@ -1,13 +1,10 @@
 """Seat domain tools - Seat updates, special services, seat map display."""
 from __future__ import annotations as _annotations
 
-import random
-import string
-
 from agents import RunContextWrapper, function_tool
 
 from ..context import AirlineAgentChatContext
-from ..demo_data import apply_itinerary_defaults
+from ..demo_data import apply_itinerary_defaults, new_confirmation_number
 
 
 @function_tool
@@ -18,7 +15,6 @@ async def update_seat(
     apply_itinerary_defaults(context.context.state)
     context.context.state.confirmation_number = confirmation_number
     context.context.state.seat_number = new_seat
-    assert context.context.state.flight_number is not None, "Flight number is required"
     return f"Updated seat to {new_seat} for confirmation number {confirmation_number}"
 
 
@@ -35,9 +31,7 @@ async def assign_special_service_seat(
     preferred_seat = "1A" if "front" in seat_request.lower() else "2A"
     ctx_state.seat_number = preferred_seat
     ctx_state.special_service_note = seat_request
-    confirmation = ctx_state.confirmation_number or "".join(
-        random.choices(string.ascii_uppercase + string.digits, k=6)
-    )
+    confirmation = ctx_state.confirmation_number or new_confirmation_number()
     ctx_state.confirmation_number = confirmation
     return (
         f"Secured {seat_request} seat {preferred_seat} on flight {ctx_state.flight_number or 'upcoming segment'}. "
@@ -8,37 +8,47 @@ ARCHITECTURE:
     main.py (Program.cs)  →  Startup config, middleware, app creation
     routes.py (Controller) →  HTTP endpoint definitions
 """
-import json
 from typing import Any, Dict
 
+import orjson
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import Response, StreamingResponse
 from chatkit.server import StreamingResult
 
-from ..server import AirlineServer
+from ..server import AirlineServer, sse_frame
 
 
-# Module-level server instance (created once, reused)
-_chat_server: AirlineServer | None = None
-
-
-def get_server() -> AirlineServer:
+async def get_server(request: Request) -> AirlineServer:
     """
     Dependency provider for AirlineServer.
     
     Similar to DI container resolution in ASP.NET:
         services.AddSingleton<AirlineServer>()
+    
+    The instance is built once in the app's lifespan startup (main.create_chat_server)
+    and stored on app.state. Declared async so FastAPI resolves it on the event loop
+    instead of the threadpool.
     """
-    global _chat_server
-    if _chat_server is None:
-        _chat_server = AirlineServer()
-    return _chat_server
+    return request.app.state.chat_server
 
 
 # Create the router - like declaring a Controller
 router = APIRouter()
 
 
+def _json_response(payload: Any) -> Response:
+    """
+    Serialize a state snapshot with orjson and return it as-is.
+
+    Returning a Response skips FastAPI's jsonable_encoder walk over the snapshot, which
+    is where the time goes (snapshots are already JSON-native, as sse_frame relies on).
+    """
+    return Response(
+        content=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        media_type="application/json",
+    )
+
+
 ##########################################################################
 # ChatKit Endpoints
 ##########################################################################
@@ -76,7 +86,12 @@ async def chatkit_endpoint(
     
     Called by: ui/components/chatkit-panel.tsx (ChatKitProvider)
     """
-    payload = await request.body()
+    # ChatKit parses the whole request as one JSON document, so the body is still
+    # collected in full, but into a single growing buffer as chunks arrive rather than
+    # a list of chunks joined into a second copy (what request.body() does).
+    payload = bytearray()
+    async for chunk in request.stream():
+        payload.extend(chunk)
     result = await server.process(payload, {"request": request})
     if isinstance(result, StreamingResult):
         return StreamingResponse(result, media_type="text/event-stream")
@@ -89,7 +104,7 @@ async def chatkit_endpoint(
 async def chatkit_state(
     thread_id: str = Query(...),
     server: AirlineServer = Depends(get_server),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get Conversation State - Snapshot of a thread's current state.
     
@@ -107,18 +122,21 @@ async def chatkit_state(
             - current_agent: Name of the active agent (e.g., "Triage Agent")
             - context: Customer context (confirmation_number, flight_number, seat)
             - agents: List of all available agents with tools and handoffs
-            - events: History of agent events (messages, handoffs, tool calls)
+            - events: Most recent agent events (messages, handoffs, tool calls),
+              capped at MAX_EVENTS per thread
+            - events_total: Count of events ever recorded; larger than len(events)
+              once older events have been dropped
             - guardrails: Input guardrail check results (passed/failed + reasoning)
     
     Called by: ui/components/runner-output.tsx (initial load)
     """
-    return await server.snapshot(thread_id, {"request": None})
+    return _json_response(await server.snapshot(thread_id, {"request": None}))
 
 
 @router.get("/chatkit/bootstrap")
 async def chatkit_bootstrap(
     server: AirlineServer = Depends(get_server),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Bootstrap Endpoint - Initialize a new conversation.
     
@@ -141,7 +159,7 @@ async def chatkit_bootstrap(
     
     Called by: ui/components/runner-output.tsx (on initial page load)
     """
-    return await server.snapshot(None, {"request": None})
+    return _json_response(await server.snapshot(None, {"request": None}))
 
 
 @router.get("/chatkit/state/stream")
@@ -162,10 +180,13 @@ async def chatkit_state_stream(
             - thread_id (required): The conversation thread to subscribe to
     
     Response:
-        SSE Stream: Continuous stream of state snapshots as JSON:
+        SSE Stream: One full state snapshot, then deltas, as JSON:
             - Initial snapshot sent immediately on connection
-            - Subsequent updates pushed when agent activity occurs
-            - events_delta: Only new events since last update (optimization)
+            - Subsequent updates pushed when agent activity occurs, carrying only
+              what changed: seq (monotonic per thread), events_delta (new events from
+              absolute index events_offset, counted like events_total), context_patch (changed public context fields),
+              current_agent, guardrails (only when they changed)
+            - Clients merge each delta into the snapshot they hold
     
     Connection Lifecycle:
         1. Client connects with thread_id
@@ -182,10 +203,10 @@ async def chatkit_state_stream(
     async def event_generator():
         try:
             initial = await server.snapshot(thread.id, {"request": None})
-            yield f"data: {json.dumps(initial, default=str)}\n\n"
+            yield sse_frame(initial)
             while True:
-                data = await queue.get()
-                yield f"data: {data}\n\n"
+                # Queue items are pre-encoded SSE frames shared by all listeners
+                yield await queue.get()
         finally:
             server.unregister_listener(thread.id, queue)
 
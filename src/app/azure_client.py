@@ -1,22 +1,85 @@
 """Shared Azure OpenAI client for use across the application."""
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+import asyncio
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable
+
+import httpx
 from openai import AsyncAzureOpenAI
 from agents import OpenAIChatCompletionsModel
 
 from .config import settings
 
-# Create Azure OpenAI client with Entra ID authentication
-credential = DefaultAzureCredential()
-token_provider = get_bearer_token_provider(credential, "https://cognitiveservices.azure.com/.default")
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
 
-azure_client = AsyncAzureOpenAI(
-    azure_ad_token_provider=token_provider,
-    api_version=settings.azure_openai_api_version,
-    azure_endpoint=settings.azure_openai_endpoint,
-)
+logger = logging.getLogger(__name__)
 
-# Model for use with agents - uses Chat Completions API
-MODEL = OpenAIChatCompletionsModel(
-    model=settings.azure_openai_deployment,
-    openai_client=azure_client,
+# One pooled HTTP/2 client for all model traffic. Guardrail and agent calls fan out
+# per turn, so the default pool limits would queue requests behind each other.
+# Closed on shutdown by the lifespan manager (see main.py).
+shared_http = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+    timeout=httpx.Timeout(30.0, connect=5.0),
 )
+
+
+# Credential, client and model are process-wide singletons behind lru_cached getters.
+# In the app they are still built during import: main.py sets the default OpenAI client and
+# every agent module passes get_model() to its Agent. Constructing them makes no network
+# calls; the first token fetch and TLS handshake happen in warmup() (or the first request).
+@lru_cache(maxsize=1)
+def get_credential() -> "DefaultAzureCredential":
+    """
+    Process-wide Entra ID credential.
+    
+    Any Azure-facing code should reuse this one instance so there is a single token
+    cache and a single credential-chain probe.
+    """
+    from azure.identity import DefaultAzureCredential
+
+    return DefaultAzureCredential()
+
+
+@lru_cache(maxsize=1)
+def get_token_provider() -> Callable[[], str]:
+    """Entra ID bearer token provider for Azure OpenAI."""
+    from azure.identity import get_bearer_token_provider
+
+    return get_bearer_token_provider(get_credential(), "https://cognitiveservices.azure.com/.default")
+
+
+@lru_cache(maxsize=1)
+def get_azure_client() -> AsyncAzureOpenAI:
+    """Shared Azure OpenAI client with Entra ID authentication."""
+    return AsyncAzureOpenAI(
+        azure_ad_token_provider=get_token_provider(),
+        api_version=settings.azure_openai_api_version,
+        azure_endpoint=settings.azure_openai_endpoint,
+        http_client=shared_http,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_model() -> OpenAIChatCompletionsModel:
+    """Model for use with agents - uses Chat Completions API."""
+    return OpenAIChatCompletionsModel(
+        model=settings.azure_openai_deployment,
+        openai_client=get_azure_client(),
+    )
+
+
+async def warmup() -> None:
+    """
+    Pay cold-start costs at startup instead of on the first user request.
+    
+    Fetches the first Entra ID token (credential chain probing + MSAL handshake)
+    and opens a pooled TLS connection to the endpoint. Failures are logged, not
+    raised, so the app still starts when Azure is unreachable.
+    """
+    try:
+        await asyncio.to_thread(get_token_provider())
+        await get_azure_client().models.list()
+    except Exception as exc:
+        logger.warning("Azure OpenAI warmup failed: %s", exc)
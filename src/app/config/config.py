@@ -33,6 +33,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
         populate_by_name=True,
+        # Read once at startup and shared process-wide; nothing may reassign a value
+        frozen=True,
     )
     
     # =========================================================================
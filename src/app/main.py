@@ -2,23 +2,27 @@ from __future__ import annotations as _annotations
 
 import os
 
+# Disable OpenAI Agents tracing before anything imports agents (tracing hooks are
+# registered at import/construction time). Also covers zero data retention orgs.
+os.environ["OPENAI_AGENTS_DISABLE_TRACING"] = "1"
+os.environ.setdefault("OPENAI_TRACING_DISABLED", "1")
+
 from .config import settings
 from .observability.telemetry_service import setup_telemetry
 from .utils.lifespan_manager import LifespanManager
 
-# Disable tracing before importing agents
-os.environ["OPENAI_AGENTS_DISABLE_TRACING"] = "1"
-
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from agents import set_default_openai_client
-from .azure_client import azure_client
+from .azure_client import get_azure_client, shared_http
+from .airline.agents import warmup
 
-set_default_openai_client(azure_client)
+set_default_openai_client(get_azure_client())
 
 # Import the router (like registering a Controller in ASP.NET)
 from .api.routes import router
+from .server import AirlineServer
 
 ##########################################################################
 # Architectural Observation - Facade Pattern
@@ -41,11 +45,26 @@ from .api.routes import router
 # Initialize telemetry (see Facade Pattern note above)
 setup_telemetry()
 
-# Lifespan manager handles startup/shutdown (port cleanup, browser, telemetry flush)
+
+async def create_chat_server() -> None:
+    """
+    Build the AirlineServer once at startup, before the app accepts traffic.
+
+    Like services.AddSingleton<AirlineServer>() in ASP.NET: routes resolve it from
+    app.state, so there is no first-request construction race.
+    """
+    app.state.chat_server = AirlineServer()
+
+
+# Lifespan manager handles startup/shutdown (port cleanup, chat server creation,
+# agent + Azure OpenAI warmup, browser, telemetry flush, closing the pooled Azure
+# OpenAI HTTP client)
 lifespan_manager = LifespanManager(
     port=settings.server_port,
     open_browser=True,
     flush_telemetry=True,
+    startup_hooks=[create_chat_server, warmup],
+    shutdown_hooks=[shared_http.aclose],
 )
 
 app = FastAPI(
@@ -53,12 +72,12 @@ app = FastAPI(
     lifespan=lifespan_manager.lifespan,
 )
 
-# Instrument FastAPI for OpenTelemetry tracing (traces all HTTP requests)
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-FastAPIInstrumentor.instrument_app(app)
-
-# Disable tracing for zero data retention orgs
-os.environ.setdefault("OPENAI_TRACING_DISABLED", "1")
+# Instrument FastAPI for OpenTelemetry tracing (traces all HTTP requests).
+# Only when telemetry is configured: otherwise the import is dead weight at startup and
+# the middleware would wrap every request in no-op spans.
+if settings.application_insights_connection_string:
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    FastAPIInstrumentor.instrument_app(app)
 
 # CORS configuration (adjust as needed for deployment)
 app.add_middleware(
@@ -67,6 +86,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers cache preflight responses for a day instead of re-preflighting every POST
+    max_age=86400,
 )
 
 # Register API routes (like app.UseEndpoints() in ASP.NET)
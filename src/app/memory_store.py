@@ -41,9 +41,16 @@ class MemoryStore(Store[dict[str, Any]]):
 
     # -- Thread metadata -------------------------------------------------
     async def load_thread(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata:
+        thread = await self.try_load_thread(thread_id, context)
+        if thread is None:
+            raise NotFoundError(f"Thread {thread_id} not found")
+        return thread
+
+    async def try_load_thread(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata | None:
+        """Like load_thread, but return None for an unknown thread instead of raising."""
         state = self._threads.get(thread_id)
         if not state:
-            raise NotFoundError(f"Thread {thread_id} not found")
+            return None
         return self._get_thread_metadata(state.thread)
 
     async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
@@ -51,9 +51,19 @@ def main():
     try:
         uvicorn.run(
             "app.main:app",
-            host="0.0.0.0",
+            host=settings.server_host,
             port=PORT,
-            reload=True,
+            # The file watcher and re-import on change are for local development only
+            reload=settings.debug,
+            # Single worker: threads, conversation state and stream listeners live in
+            # process memory (MemoryStore), so extra workers would not share them.
+            workers=1,
+            # uvloop / httptools are used when installed (uvicorn[standard])
+            loop="auto",
+            http="auto",
+            # One access-log line per request (every SSE poll included) only when debugging
+            access_log=settings.debug,
+            log_level="debug" if settings.debug else "warning",
         )
     except Exception as e:
         print(f"[CRASH] Application crashed: {e}")
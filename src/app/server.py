@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import logging
+import reprlib
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
-import json
-from typing import Any, AsyncIterator, Dict, List, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 from uuid import uuid4
 
-logging.basicConfig(level=logging.DEBUG)
+import orjson
+
+from .config import settings
+
+# Root DEBUG also turns on openai/httpx/httpcore request logging for every model call,
+# so only use it when DEBUG is set.
+logging.basicConfig(level=logging.DEBUG if settings.debug else logging.INFO)
 logger = logging.getLogger(__name__)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from agents import (
-    Handoff,
     HandoffOutputItem,
     InputGuardrailTripwireTriggered,
     ItemHelpers,
@@ -39,10 +46,9 @@ from chatkit.types import (
     WidgetItem,
     ProgressUpdateEvent,
 )
-from chatkit.store import NotFoundError
 
 from .airline.context import AirlineAgentChatContext, AirlineAgentContext, create_initial_context, public_context
-from .airline.agents import triage_agent
+from .airline.agents import HANDOFF_CALLBACK_NAMES, triage_agent
 from .airline.orchestrator import Orchestrator
 from .memory_store import MemoryStore
 
@@ -51,6 +57,11 @@ from .memory_store import MemoryStore
 
 
 class AgentEvent(BaseModel):
+    # Recorded via model_construct: every field is produced server-side with the right
+    # type, so per-event validation on the streaming path is skipped. Frozen because
+    # dump() caches the serialized dict.
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: str
     agent: str
@@ -58,8 +69,21 @@ class AgentEvent(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     timestamp: Optional[float] = None
 
+    # Events are never modified after they are recorded, so dump once and reuse the dict
+    # for every snapshot, broadcast and runner_event_delta that includes this event.
+    _dumped: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def dump(self) -> Dict[str, Any]:
+        """Cached model_dump()."""
+        if self._dumped is None:
+            self._dumped = self.model_dump()
+        return self._dumped
+
 
 class GuardrailCheck(BaseModel):
+    # Replaced wholesale each turn, never edited; broadcasts compare the list by identity
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     input: str
@@ -85,20 +109,56 @@ def _get_guardrail_name(g) -> str:
     return str(g)
 
 
-class AirlineServer(ChatKitServer):
-    """Main server handling airline agent orchestration."""
+# Agent name -> ((guardrail, display name), ...), filled in on first use per agent.
+_AGENT_GUARDRAILS: Dict[str, tuple[tuple[Any, str], ...]] = {}
 
-    def _build_agents_list(self) -> List[Dict[str, Any]]:
-        """Build a list of all available agents and their metadata."""
-        def make_agent_dict(agent):
-            return {
-                "name": agent.name,
-                "description": getattr(agent, "handoff_description", ""),
-                "handoffs": [getattr(h, "agent_name", getattr(h, "name", "")) for h in getattr(agent, "handoffs", [])],
-                "tools": [getattr(t, "name", getattr(t, "__name__", "")) for t in getattr(agent, "tools", [])],
-                "input_guardrails": [_get_guardrail_name(g) for g in getattr(agent, "input_guardrails", [])],
-            }
-        return [make_agent_dict(agent) for agent in self._orchestrator.agents.values()]
+
+def _guardrails_for(agent) -> tuple[tuple[Any, str], ...]:
+    """An agent's input guardrails paired with their friendly names (cached per agent)."""
+    cached = _AGENT_GUARDRAILS.get(agent.name)
+    if cached is None:
+        cached = tuple((g, _get_guardrail_name(g)) for g in getattr(agent, "input_guardrails", []))
+        _AGENT_GUARDRAILS[agent.name] = cached
+    return cached
+
+
+# Bounded repr for tool outputs shown in the runner panel: stops descending into large
+# dicts/lists instead of building their full str() only to slice off the first 200 chars.
+_PREVIEW_REPR = reprlib.Repr()
+_PREVIEW_REPR.maxstring = 200
+_PREVIEW_REPR.maxother = 200
+_PREVIEW_REPR.maxdict = 8
+_PREVIEW_REPR.maxlist = 8
+
+
+# Frames buffered per state-stream listener before the oldest are dropped.
+LISTENER_QUEUE_SIZE = 256
+
+
+def _fan_out(listeners: List[asyncio.Queue], payload: bytes) -> None:
+    """
+    Put the same encoded frame on every listener queue.
+
+    A slow client's full queue drops its oldest frame rather than growing without bound;
+    the gap shows up in the frame seq numbers.
+    """
+    for q in list(listeners):
+        if q.full():
+            q.get_nowait()
+        q.put_nowait(payload)
+
+
+# Payloads hold only JSON-native values (int ms timestamps, str ids, tool results
+# normalized recursively by _json_native), so no Python default= fallback is needed.
+# OPT_NON_STR_KEYS keeps stdlib json's key coercion for context dicts with int/UUID keys.
+_dumps = orjson.dumps
+_SSE_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+def sse_frame(payload_obj: Any) -> bytes:
+    """Encode a payload once as a complete SSE frame (bytes) shared by every listener."""
+    # orjson output is already compact (no separator spaces)
+    return b"".join((b"data: ", _dumps(payload_obj, option=_SSE_OPTS), b"\n\n"))
 
 
 def _user_message_to_text(message: UserMessageItem) -> str:
@@ -110,25 +170,81 @@ def _user_message_to_text(message: UserMessageItem) -> str:
     return "".join(parts)
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_native(val: Any) -> Any:
+    """
+    Convert a value to what orjson (SSE frames and snapshot responses) encodes natively.
+
+    Walks dicts, lists and tuples, dumps pydantic models in JSON mode and stringifies any
+    other leaf (datetime, Decimal, custom objects), so nothing nested can fail to encode.
+    """
+    if isinstance(val, _JSON_SCALARS):
+        return val
+    if isinstance(val, dict):
+        return {k: _json_native(v) for k, v in val.items()}
+    if isinstance(val, (list, tuple)):
+        return [_json_native(v) for v in val]
+    if isinstance(val, BaseModel):
+        return val.model_dump(mode="json")
+    return str(val)
+
+
 def _parse_tool_args(raw_args: Any) -> Any:
     if isinstance(raw_args, str):
         try:
-            import json
-
-            return json.loads(raw_args)
+            return orjson.loads(raw_args)
         except Exception:
             return raw_args
     return raw_args
 
 
+# Runner-panel effect batching during streaming: flush at this many pending events, or
+# as soon as a step closes (anything but a tool call still waiting for its output).
+EFFECT_BATCH_SIZE = 8
+
+# Per-thread cap on retained runner events; older ones are dropped from snapshots.
+MAX_EVENTS = 500
+
+
 @dataclass
 class ConversationState:
     input_items: List[Any] = field(default_factory=list)
     context: AirlineAgentContext = field(default_factory=create_initial_context)
     current_agent_name: str = triage_agent.name
-    events: List[AgentEvent] = field(default_factory=list)
+    events: Deque[AgentEvent] = field(default_factory=lambda: deque(maxlen=MAX_EVENTS))
+    # Events ever recorded; exceeds len(events) once the deque starts evicting.
+    events_total: int = 0
     guardrails: List[GuardrailCheck] = field(default_factory=list)
 
+    def add_events(self, new_events: List[AgentEvent]) -> None:
+        """Append events, keeping events_total in step with what was recorded."""
+        self.events.extend(new_events)
+        self.events_total += len(new_events)
+
+
+class AirlineServer(ChatKitServer):
+    """Main server handling airline agent orchestration."""
+
+    def _build_agents_list(self) -> List[Dict[str, Any]]:
+        """Build a list of all available agents and their metadata."""
+        # Agents, handoffs, tools and guardrails are fixed once the package is wired, so the
+        # metadata is built on first use and reused by every snapshot.
+        cached = getattr(self, "_agents_list", None)
+        if cached is not None:
+            return cached
+
+        def make_agent_dict(agent):
+            return {
+                "name": agent.name,
+                "description": getattr(agent, "handoff_description", ""),
+                "handoffs": [getattr(h, "agent_name", getattr(h, "name", "")) for h in getattr(agent, "handoffs", [])],
+                "tools": [getattr(t, "name", getattr(t, "__name__", "")) for t in getattr(agent, "tools", [])],
+                "input_guardrails": [_get_guardrail_name(g) for g in getattr(agent, "input_guardrails", [])],
+            }
+        self._agents_list = [make_agent_dict(agent) for agent in self._orchestrator.agents.values()]
+        return self._agents_list
 
     def __init__(self) -> None:
         self.store = MemoryStore()
@@ -136,7 +252,10 @@ class ConversationState:
         self._state: Dict[str, ConversationState] = {}
         self._listeners: Dict[str, list[asyncio.Queue]] = {}
         self._last_event_index: Dict[str, int] = {}
-        self._last_snapshot: Dict[str, str] = {}
+        self._last_context: Dict[str, Dict[str, Any]] = {}
+        self._last_guardrails: Dict[str, List[GuardrailCheck]] = {}
+        self._seq: Dict[str, int] = {}
+        self._broadcast_pending: set[str] = set()
         self._orchestrator = Orchestrator()
 
     def _state_for_thread(self, thread_id: str) -> ConversationState:
@@ -148,10 +267,10 @@ class ConversationState:
         self, thread_id: Optional[str], context: dict[str, Any]
     ) -> ThreadMetadata:
         if thread_id:
-            try:
-                return await self.store.load_thread(thread_id, context)
-            except NotFoundError:
-                pass
+            # Unknown ids are routine here (fresh UI sessions), so no exception round-trip
+            thread = await self.store.try_load_thread(thread_id, context)
+            if thread is not None:
+                return thread
         new_thread = ThreadMetadata(id=self.store.generate_thread_id(context), created_at=datetime.now())
         await self.store.save_thread(new_thread, context)
         self._state_for_thread(new_thread.id)
@@ -168,20 +287,22 @@ class ConversationState:
         guardrail_results: List[Any],
     ) -> List[GuardrailCheck]:
         checks: List[GuardrailCheck] = []
-        timestamp = time.time() * 1000
-        agent = self._orchestrator.get_agent(agent_name)
-        for guardrail in getattr(agent, "input_guardrails", []):
-            result = next((r for r in guardrail_results if r.guardrail == guardrail), None)
+        timestamp = time.time_ns() // 1_000_000
+        # Matched by name: a pre-routed turn runs a blocking copy of the agent's guardrail
+        results_by_name = {_get_guardrail_name(r.guardrail): r for r in guardrail_results}
+        for _guardrail, name in _guardrails_for(self._orchestrator.get_agent(agent_name)):
+            result = results_by_name.get(name)
             reasoning = ""
             passed = True
             if result:
                 info = getattr(result.output, "output_info", None)
                 reasoning = getattr(info, "reasoning", "") or reasoning
                 passed = not result.output.tripwire_triggered
+            # Trusted, already-typed values: skip pydantic validation
             checks.append(
-                GuardrailCheck(
+                GuardrailCheck.model_construct(
                     id=uuid4().hex,
-                    name=_get_guardrail_name(guardrail),
+                    name=name,
                     input=input_text,
                     reasoning=reasoning,
                     passed=passed,
@@ -190,6 +311,15 @@ class ConversationState:
             )
         return checks
 
+    @staticmethod
+    def _preview(val: Any, limit: int = 200) -> str:
+        """Short display text for any value without stringifying large containers in full."""
+        if isinstance(val, str):
+            text = val
+        else:
+            text = str(val) if isinstance(val, (int, float, bool)) or val is None else _PREVIEW_REPR.repr(val)
+        return text if len(text) <= limit else text[:limit] + "…"
+
     @staticmethod
     def _truncate(val: Any, limit: int = 200) -> Any:
         if isinstance(val, str) and len(val) > limit:
@@ -201,12 +331,14 @@ class ConversationState:
         listeners = self._listeners.get(thread.id, [])
         if not listeners:
             return
-        payload = json.dumps({"events_delta": [e.model_dump() for e in delta_events]}, default=str)
-        for q in list(listeners):
-            try:
-                q.put_nowait(payload)
-            except asyncio.QueueFull:
-                pass
+        payload = sse_frame({"seq": self._next_seq(thread.id), "events_delta": [e.dump() for e in delta_events]})
+        _fan_out(listeners, payload)
+
+    def _next_seq(self, thread_id: str) -> int:
+        """Monotonic per-thread frame counter so stream clients can order and detect gaps."""
+        seq = self._seq.get(thread_id, 0) + 1
+        self._seq[thread_id] = seq
+        return seq
 
     def _record_events(
         self,
@@ -216,12 +348,13 @@ class ConversationState:
     ) -> tuple[List[AgentEvent], str]:
         events: List[AgentEvent] = []
         active_agent = current_agent_name
+        # One timestamp per batch: the items of a single runner step arrive together
+        now_ms = time.time_ns() // 1_000_000
         for item in run_items:
-            now_ms = time.time() * 1000
             if isinstance(item, MessageOutputItem):
                 text = self._truncate(ItemHelpers.text_message_output(item))
                 events.append(
-                    AgentEvent(
+                    AgentEvent.model_construct(
                         id=uuid4().hex,
                         type="message",
                         agent=item.agent.name,
@@ -231,7 +364,7 @@ class ConversationState:
                 )
             elif isinstance(item, HandoffOutputItem):
                 events.append(
-                    AgentEvent(
+                    AgentEvent.model_construct(
                         id=uuid4().hex,
                         type="handoff",
                         agent=item.source_agent.name,
@@ -241,40 +374,24 @@ class ConversationState:
                     )
                 )
 
-                from_agent = item.source_agent
                 to_agent = item.target_agent
-                ho = next(
-                    (
-                        h
-                        for h in getattr(from_agent, "handoffs", [])
-                        if isinstance(h, Handoff) and getattr(h, "agent_name", None) == to_agent.name
-                    ),
-                    None,
-                )
-                if ho:
-                    fn = ho.on_invoke_handoff
-                    fv = fn.__code__.co_freevars
-                    cl = fn.__closure__ or []
-                    if "on_handoff" in fv:
-                        idx = fv.index("on_handoff")
-                        if idx < len(cl) and cl[idx].cell_contents:
-                            cb = cl[idx].cell_contents
-                            cb_name = getattr(cb, "__name__", repr(cb))
-                            events.append(
-                                AgentEvent(
-                                    id=uuid4().hex,
-                                    type="tool_call",
-                                    agent=to_agent.name,
-                                    content=cb_name,
-                                    timestamp=now_ms,
-                                )
-                            )
+                cb_name = HANDOFF_CALLBACK_NAMES.get(to_agent.name)
+                if cb_name:
+                    events.append(
+                        AgentEvent.model_construct(
+                            id=uuid4().hex,
+                            type="tool_call",
+                            agent=to_agent.name,
+                            content=cb_name,
+                            timestamp=now_ms,
+                        )
+                    )
 
                 active_agent = to_agent.name
             elif isinstance(item, ToolCallItem):
                 tool_name = getattr(item.raw_item, "name", None)
                 raw_args = getattr(item.raw_item, "arguments", None)
-                ev = AgentEvent(
+                ev = AgentEvent.model_construct(
                     id=uuid4().hex,
                     type="tool_call",
                     agent=item.agent.name,
@@ -284,12 +401,12 @@ class ConversationState:
                 )
                 events.append(ev)
             elif isinstance(item, ToolCallOutputItem):
-                ev = AgentEvent(
+                ev = AgentEvent.model_construct(
                     id=uuid4().hex,
                     type="tool_output",
                     agent=item.agent.name,
-                    content=self._truncate(str(item.output)),
-                    metadata={"tool_result": self._truncate(item.output)},
+                    content=self._preview(item.output),
+                    metadata={"tool_result": self._truncate(_json_native(item.output))},
                     timestamp=now_ms,
                 )
                 events.append(ev)
@@ -316,86 +433,70 @@ class ConversationState:
             state=state.context,
         )
         streamed_items_seen = 0
+        pending_events: List[AgentEvent] = []
 
         # Tell the client which thread to bind runner updates to before streaming starts.
         yield ClientEffectEvent(name="runner_bind_thread", data={"thread_id": thread.id, "ts": time.time()})
 
         try:
             # === ORCHESTRATION CALL ===
-            # For debugging, set breakpoint in airline/orchestrator.py at Orchestrator.run()
+            # For debugging, set breakpoint in airline/orchestrator.py at Orchestrator.route()
+            # (pre-routing unambiguous first turns past triage) and step into the Runner
             result = Runner.run_streamed(
-                self._orchestrator.get_agent(state.current_agent_name),
+                self._orchestrator.route(state.current_agent_name, state.input_items),
                 state.input_items,
                 context=chat_context,
             )
             # === PLUMBING: Event recording and broadcasting (developers can ignore) ===
-            async for event in stream_agent_response(chat_context, result):
-                if isinstance(event, ProgressUpdateEvent) or getattr(event, "type", "") == "progress_update_event":
-                    # Ignore progress updates for the Runner panel; ChatKit will handle them separately.
-                    continue
-                # If this is a run-item event, convert and broadcast immediately.
-                if hasattr(event, "item"):
-                    try:
-                        run_item = getattr(event, "item")
+            # Runner-panel effects are batched: flushed once EFFECT_BATCH_SIZE events are
+            # pending or a step closes, so a tool call goes out together with its output.
+            stream = stream_agent_response(chat_context, result)
+            try:
+                async for event in stream:
+                    if isinstance(event, ProgressUpdateEvent) or getattr(event, "type", "") == "progress_update_event":
+                        # Ignore progress updates for the Runner panel; ChatKit will handle them separately.
+                        continue
+                    yield event
+                    # result.new_items is the authoritative run-item log; record only what is new
+                    new_items = result.new_items[streamed_items_seen:]
+                    if new_items:
                         new_events, active_agent = self._record_events(
-                            [run_item], state.current_agent_name, thread.id
+                            new_items, state.current_agent_name, thread.id
                         )
-                        if new_events:
-                            state.events.extend(new_events)
-                            state.current_agent_name = active_agent
-                            await self._broadcast_state(thread, context)
-                            yield ClientEffectEvent(
-                                name="runner_state_update",
-                                data={"thread_id": thread.id, "ts": time.time()},
-                            )
-                            yield ClientEffectEvent(
-                                name="runner_event_delta",
-                                data={
-                                    "thread_id": thread.id,
-                                    "ts": time.time(),
-                                    "events": [e.model_dump() for e in new_events],
-                                },
-                            )
-                    except Exception as err:
-                        logger.exception("Error processing event: %s", err)
-                yield event
-                new_items = result.new_items[streamed_items_seen:]
-                if new_items:
-                    new_events, active_agent = self._record_events(
-                        new_items, state.current_agent_name, thread.id
-                    )
-                    state.events.extend(new_events)
-                    state.current_agent_name = active_agent
-                    streamed_items_seen += len(new_items)
-                    await self._broadcast_state(thread, context)
-                    yield ClientEffectEvent(
-                        name="runner_state_update",
-                        data={"thread_id": thread.id, "ts": time.time()},
-                    )
-                    yield ClientEffectEvent(
-                        name="runner_event_delta",
-                        data={
-                            "thread_id": thread.id,
-                            "ts": time.time(),
-                            "events": [e.model_dump() for e in new_events],
-                        },
-                    )
+                        state.add_events(new_events)
+                        state.current_agent_name = active_agent
+                        streamed_items_seen += len(new_items)
+                        self._schedule_broadcast(thread)
+                        pending_events.extend(new_events)
+                        if pending_events and (
+                            len(pending_events) >= EFFECT_BATCH_SIZE or pending_events[-1].type != "tool_call"
+                        ):
+                            for effect in self._runner_effects(thread, pending_events):
+                                yield effect
+                            pending_events = []
+            finally:
+                # Client went away or the turn was cancelled: close the ChatKit stream and
+                # stop the Runner rather than leaving it half-consumed
+                await stream.aclose()
+                if not result.is_complete:
+                    result.cancel()
         except MaxTurnsExceeded:
             await self._broadcast_state(thread, context)
         except InputGuardrailTripwireTriggered as exc:
-            failed_guardrail = exc.guardrail_result.guardrail
+            failed_name = _get_guardrail_name(exc.guardrail_result.guardrail)
             gr_output = exc.guardrail_result.output.output_info
             reasoning = getattr(gr_output, "reasoning", "")
-            timestamp = time.time() * 1000
+            timestamp = time.time_ns() // 1_000_000
             checks: List[GuardrailCheck] = []
-            for guardrail in self._orchestrator.get_agent(state.current_agent_name).input_guardrails:
+            for _guardrail, name in _guardrails_for(self._orchestrator.get_agent(state.current_agent_name)):
+                failed = name == failed_name
                 checks.append(
-                    GuardrailCheck(
+                    GuardrailCheck.model_construct(
                         id=uuid4().hex,
-                        name=_get_guardrail_name(guardrail),
+                        name=name,
                         input=user_text,
-                        reasoning=reasoning if guardrail == failed_guardrail else "",
-                        passed=guardrail != failed_guardrail,
+                        reasoning=reasoning if failed else "",
+                        passed=not failed,
                         timestamp=timestamp,
                     )
                 )
@@ -414,7 +515,9 @@ class ConversationState:
         state.input_items = result.to_input_list()
         remaining_items = result.new_items[streamed_items_seen:]
         new_events, active_agent = self._record_events(remaining_items, state.current_agent_name, thread.id)
-        state.events.extend(new_events)
+        state.add_events(new_events)
+        # Events still waiting for a flush go out with the end-of-turn delta
+        new_events = pending_events + new_events
         final_agent_name = active_agent
         try:
             final_agent_name = result.last_agent.name
@@ -430,16 +533,16 @@ class ConversationState:
         new_context = public_context(state.context)
         changes = {k: new_context[k] for k in new_context if previous_context.get(k) != new_context[k]}
         if changes:
-            state.events.append(
-                AgentEvent(
+            state.add_events([
+                AgentEvent.model_construct(
                     id=uuid4().hex,
                     type="context_update",
                     agent=state.current_agent_name,
                     content="",
                     metadata={"changes": changes},
-                    timestamp=time.time() * 1000,
+                    timestamp=time.time_ns() // 1_000_000,
                 )
-            )
+            ])
         await self._broadcast_state(thread, context)
         yield ClientEffectEvent(
             name="runner_state_update",
@@ -451,10 +554,22 @@ class ConversationState:
                 data={
                     "thread_id": thread.id,
                     "ts": time.time(),
-                    "events": [e.model_dump() for e in new_events],
+                    "events": [e.dump() for e in new_events],
                 },
             )
 
+    @staticmethod
+    def _runner_effects(thread: ThreadMetadata, new_events: List[AgentEvent]) -> tuple[ClientEffectEvent, ClientEffectEvent]:
+        """One runner_state_update plus one runner_event_delta carrying every event in the batch."""
+        now = time.time()
+        return (
+            ClientEffectEvent(name="runner_state_update", data={"thread_id": thread.id, "ts": now}),
+            ClientEffectEvent(
+                name="runner_event_delta",
+                data={"thread_id": thread.id, "ts": now, "events": [e.dump() for e in new_events]},
+            ),
+        )
+
     async def action(
         self,
         thread: ThreadMetadata,
@@ -474,21 +589,15 @@ class ConversationState:
             "current_agent": state.current_agent_name,
             "context": public_context(state.context),
             "agents": self._build_agents_list(),
-            "events": [e.model_dump() for e in state.events],
+            "events": [e.dump() for e in state.events],
+            "events_total": state.events_total,
             "guardrails": [g.model_dump() for g in state.guardrails],
         }
 
     # -- Streaming state updates to UI listeners ---------------------------------
     def _register_listener(self, thread_id: str) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue()
+        q: asyncio.Queue = asyncio.Queue(maxsize=LISTENER_QUEUE_SIZE)
         self._listeners.setdefault(thread_id, []).append(q)
-        # Push last snapshot if available so late listeners get current state immediately.
-        last = self._last_snapshot.get(thread_id)
-        if last:
-            try:
-                q.put_nowait(last)
-            except asyncio.QueueFull:
-                pass
         return q
 
     def register_listener(self, thread_id: str) -> asyncio.Queue:
@@ -506,24 +615,60 @@ class ConversationState:
         """Public wrapper for listener cleanup."""
         self._unregister_listener(thread_id, queue)
 
+    def _schedule_broadcast(self, thread: ThreadMetadata) -> None:
+        """Coalesce broadcasts during streaming: at most one state push per event-loop tick."""
+        if thread.id in self._broadcast_pending or not self._listeners.get(thread.id):
+            return
+        self._broadcast_pending.add(thread.id)
+        asyncio.get_running_loop().call_soon(self._flush_broadcast, thread)
+
+    def _flush_broadcast(self, thread: ThreadMetadata) -> None:
+        # Skipped when an immediate _broadcast_state already sent this state
+        if thread.id in self._broadcast_pending:
+            self._broadcast_pending.discard(thread.id)
+            self._push_state(thread)
+
     async def _broadcast_state(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
+        """Push state to listeners now (end of turn, errors), superseding any scheduled push."""
+        self._broadcast_pending.discard(thread.id)
+        self._push_state(thread)
+
+    def _push_state(self, thread: ThreadMetadata) -> None:
+        """
+        Push what changed since the last broadcast; listeners get one full snapshot on connect.
+        
+        Payload: seq (per-thread frame counter), events_delta (new events, starting at index
+        events_offset), context_patch (public context fields whose values changed),
+        current_agent, and guardrails only when the turn's results changed.
+        """
         listeners = self._listeners.get(thread.id, [])
         if not listeners:
             return
-        snap = await self.snapshot(thread.id, context)
-        # Compute delta of new events since last broadcast to reduce payloads
+        state = self._state_for_thread(thread.id)
+        # Indexes count every event ever recorded (events_total), so eviction from the
+        # bounded deque cannot shift the offsets already sent to listeners.
         last_idx = self._last_event_index.get(thread.id, 0)
-        total_events = len(snap.get("events", []))
-        delta = snap.get("events", [])[last_idx:] if total_events >= last_idx else snap.get("events", [])
-        self._last_event_index[thread.id] = total_events
-        payload_obj = {
-            **snap,
-            "events_delta": delta,
+        if last_idx > state.events_total:
+            last_idx = 0
+        self._last_event_index[thread.id] = state.events_total
+        pending = min(state.events_total - last_idx, len(state.events))
+        ctx = public_context(state.context)
+        previous = self._last_context.get(thread.id, {})
+        self._last_context[thread.id] = ctx
+        context_patch = {k: v for k, v in ctx.items() if k not in previous or previous[k] != v}
+        # Fields public_context stopped emitting (e.g. vouchers cleared) are patched to None
+        context_patch.update(dict.fromkeys(previous.keys() - ctx.keys()))
+        payload_obj: Dict[str, Any] = {
+            "seq": self._next_seq(thread.id),
+            "thread_id": thread.id,
+            "current_agent": state.current_agent_name,
+            "events_offset": state.events_total - pending,
+            "events_delta": [e.dump() for e in islice(state.events, len(state.events) - pending, None)],
+            "context_patch": context_patch,
         }
-        payload = json.dumps(payload_obj, default=str)
-        self._last_snapshot[thread.id] = payload
-        for q in list(listeners):
-            try:
-                q.put_nowait(payload)
-            except asyncio.QueueFull:
-                pass
+        # Guardrail results are replaced wholesale once per turn; resend only when they change
+        if self._last_guardrails.get(thread.id) is not state.guardrails:
+            self._last_guardrails[thread.id] = state.guardrails
+            payload_obj["guardrails"] = [g.model_dump() for g in state.guardrails]
+        payload = sse_frame(payload_obj)
+        _fan_out(listeners, payload)
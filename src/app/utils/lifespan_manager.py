@@ -5,13 +5,15 @@ Handles common startup/shutdown tasks:
 - Port cleanup (kill orphan processes)
 - Browser auto-open for Swagger UI and optional frontend
 - Telemetry flush on shutdown
+- Optional async startup hooks (e.g. warming API connections)
+- Optional async shutdown hooks (e.g. closing shared HTTP clients)
 
 Usage:
     lifespan_manager = LifespanManager(port=8000, open_browser=True, frontend_url="http://localhost:3000")
     app = FastAPI(lifespan=lifespan_manager.lifespan)
 """
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Awaitable, Callable, Optional, Sequence
 
 from fastapi import FastAPI
 from opentelemetry import trace
@@ -33,6 +35,8 @@ class LifespanManager:
         open_browser: bool = True,
         flush_telemetry: bool = True,
         frontend_url: Optional[str] = None,
+        startup_hooks: Optional[Sequence[Callable[[], Awaitable[None]]]] = None,
+        shutdown_hooks: Optional[Sequence[Callable[[], Awaitable[None]]]] = None,
     ) -> None:
         """
         Initialize the lifespan manager.
@@ -42,22 +46,28 @@ class LifespanManager:
             open_browser: Whether to auto-open Swagger UI on startup
             flush_telemetry: Whether to flush OpenTelemetry on shutdown
             frontend_url: Optional frontend URL to open (e.g., "http://localhost:3000")
+            startup_hooks: Optional async callables awaited on startup
+            shutdown_hooks: Optional async callables awaited on shutdown
         """
         self._port = port
         self._open_browser = open_browser
         self._flush_telemetry = flush_telemetry
         self._frontend_url = frontend_url
+        self._startup_hooks = list(startup_hooks or [])
+        self._shutdown_hooks = list(shutdown_hooks or [])
 
     @asynccontextmanager
     async def lifespan(self, app: FastAPI):
         """
         Async context manager for FastAPI lifespan.
         
-        Startup: Cleans port, optionally opens browser
-        Shutdown: Flushes telemetry, cleans port
+        Startup: Cleans port, runs startup hooks, optionally opens browser
+        Shutdown: Runs shutdown hooks, flushes telemetry, cleans port
         """
         # --- STARTUP runs when app starts ---
         PortCleanup.kill_process_on_port(self._port)
+        for hook in self._startup_hooks:
+            await hook()
         if self._open_browser:
             BrowserOpener.open_swagger_ui_background(port=self._port, delay_seconds=2.0)
         if self._frontend_url:
@@ -68,6 +78,8 @@ class LifespanManager:
                # Upon yield, control is returned to FastAPI and the app code runs
               
                # --- SHUTDOWN runs when when app stops ---
+        for hook in self._shutdown_hooks:
+            await hook()
         if self._flush_telemetry:
             self._shutdown_telemetry()
         PortCleanup.kill_process_on_port(self._port)
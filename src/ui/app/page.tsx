@@ -39,7 +39,9 @@ export default function Home() {
 
     setCurrentAgent(data.current_agent || "");
     setContext(data.context || {});
-    if (Array.isArray(data.agents)) setAgents(data.agents);
+    // The agent roster is fixed for the server's lifetime: keep the array already
+    // rendered so the agents list doesn't re-render after every turn.
+    if (Array.isArray(data.agents)) setAgents((prev) => (prev.length ? prev : data.agents));
     if (Array.isArray(data.events)) {
       setEvents(
         data.events.map((e: any) => ({
@@ -27,8 +27,9 @@ export function AgentPanel({
   const [selectedSeat, setSelectedSeat] = useState<string | undefined>(undefined);
   
   const activeAgent = agents.find((a) => a.name === currentAgent);
-  const runnerEvents = events.filter(
-    (e) => e.type !== "message" && e.type !== "progress_update"
+  const runnerEvents = useMemo(
+    () => events.filter((e) => e.type !== "message" && e.type !== "progress_update"),
+    [events]
   );
 
   // Check if seat map should be shown based on tool output
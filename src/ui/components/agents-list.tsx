@@ -1,5 +1,6 @@
 "use client";
 
+import { memo } from "react";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Bot } from "lucide-react";
@@ -11,7 +12,9 @@ interface AgentsListProps {
   currentAgent: string;
 }
 
-export function AgentsList({ agents, currentAgent }: AgentsListProps) {
+// Memoized: re-renders only when the roster or the active agent changes, not on every
+// runner event or context update the panel receives.
+export const AgentsList = memo(function AgentsList({ agents, currentAgent }: AgentsListProps) {
   const activeAgent = agents.find((a) => a.name === currentAgent);
   return (
     <PanelSection
@@ -53,4 +56,4 @@ export function AgentsList({ agents, currentAgent }: AgentsListProps) {
       </div>
     </PanelSection>
   );
-}
+});
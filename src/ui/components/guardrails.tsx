@@ -15,12 +15,15 @@ export function Guardrails({ guardrails, inputGuardrails }: GuardrailsProps) {
   const guardrailNameMap: Record<string, string> = {
     relevance_guardrail: "Relevance Guardrail",
     jailbreak_guardrail: "Jailbreak Guardrail",
+    safety_guardrail: "Safety Guardrail",
   };
 
   const guardrailDescriptionMap: Record<string, string> = {
     "Relevance Guardrail": "Ensure messages are relevant to airline support",
     "Jailbreak Guardrail":
       "Detect and block attempts to bypass or override system instructions",
+    "Safety Guardrail":
+      "Check relevance to airline support and block jailbreak attempts",
   };
 
   const extractGuardrailName = (rawName: string): string =>
@@ -10,7 +10,7 @@ import {
   MessageSquareMore,
   ChevronDown,
 } from "lucide-react";
-import { useState } from "react";
+import { memo, useMemo, useState } from "react";
 import { PanelSection } from "./panel-section";
 
 interface RunnerOutputProps {
@@ -112,7 +112,7 @@ function buildEventText(event: AgentEvent) {
   }
 }
 
-function EventDetails({ event }: { event: AgentEvent }) {
+const EventDetails = memo(function EventDetails({ event }: { event: AgentEvent }) {
   const [expanded, setExpanded] = useState(false);
   const toolArgs = event.metadata?.tool_args;
   const toolResult = event.metadata?.tool_result;
@@ -218,10 +218,18 @@ function EventDetails({ event }: { event: AgentEvent }) {
       </div>
     </div>
   );
-}
+});
+
+// Cards rendered by default; the server keeps up to 500 events, so older cards are
+// shown only on request to keep long sessions cheap to render.
+const VISIBLE_GROUPS = 40;
 
 export function RunnerOutput({ runnerEvents }: RunnerOutputProps) {
-  const groupedEvents = groupRunnerEvents(runnerEvents);
+  const [showAll, setShowAll] = useState(false);
+  // Regroup only when the events change, not on every parent render (seat selection etc.)
+  const groupedEvents = useMemo(() => groupRunnerEvents(runnerEvents), [runnerEvents]);
+  const hiddenCount = showAll ? 0 : Math.max(0, groupedEvents.length - VISIBLE_GROUPS);
+  const visibleGroups = hiddenCount ? groupedEvents.slice(hiddenCount) : groupedEvents;
 
   return (
     <div className="flex-1 overflow-hidden">
@@ -236,26 +244,38 @@ export function RunnerOutput({ runnerEvents }: RunnerOutputProps) {
                 No runner events yet
               </p>
             ) : (
-              groupedEvents.map((group) => {
-                const agentName = group[0]?.agent ?? "Agent";
-                const key = group.map((ev) => ev.id).join("-");
-                return (
-                  <Card
-                    key={key}
-                    className="border border-gray-200 bg-white shadow-sm rounded-lg"
+              <>
+                {hiddenCount > 0 && (
+                  <button
+                    type="button"
+                    onClick={() => setShowAll(true)}
+                    className="w-full text-center text-xs text-gray-500 hover:text-gray-700 py-1"
                   >
-                    <CardHeader className="flex flex-row items-center px-3 py-2">
-                      <span className="text-sm text-gray-800 font-medium">{agentName}</span>
-                    </CardHeader>
+                    Show {hiddenCount} older {hiddenCount === 1 ? "entry" : "entries"}
+                  </button>
+                )}
+                {visibleGroups.map((group) => {
+                  const agentName = group[0]?.agent ?? "Agent";
+                  // Keyed by the first event so a group that grows is updated in place
+                  // instead of remounted with all of its rows.
+                  return (
+                    <Card
+                      key={group[0]?.id}
+                      className="border border-gray-200 bg-white shadow-sm rounded-lg"
+                    >
+                      <CardHeader className="flex flex-row items-center px-3 py-2">
+                        <span className="text-sm text-gray-800 font-medium">{agentName}</span>
+                      </CardHeader>
 
-                    <CardContent className="p-3 pt-0 space-y-2">
-                      {group.map((event) => (
-                        <EventDetails key={event.id} event={event} />
-                      ))}
-                    </CardContent>
-                  </Card>
-                );
-              })
+                      <CardContent className="p-3 pt-0 space-y-2">
+                        {group.map((event) => (
+                          <EventDetails key={event.id} event={event} />
+                        ))}
+                      </CardContent>
+                    </Card>
+                  );
+                })}
+              </>
             )}
           </div>
         </ScrollArea>
@@ -0,0 +1,29 @@
+"""Test setup: import the app from src/ and give it placeholder Azure settings."""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Same as main.py: no tracing export from the Agents SDK
+os.environ["OPENAI_AGENTS_DISABLE_TRACING"] = "1"
+
+# Settings requires these at import; no request ever reaches the endpoint (see FakeModel)
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.invalid")
+os.environ.setdefault("AZURE_OPENAI_API_VERSION", "2024-10-21")
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Swap the scripted FakeModel in for every agent and the safety guardrail."""
+    from fake_model import FakeModel
+
+    from app.airline import guardrails
+    from app.airline.orchestrator import _AGENT_REGISTRY, _PREROUTED_AGENTS
+
+    fake = FakeModel()
+    for agent in (*_AGENT_REGISTRY.values(), *_PREROUTED_AGENTS.values(), guardrails.safety_agent):
+        monkeypatch.setattr(agent, "model", fake)
+    return fake
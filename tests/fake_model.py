@@ -0,0 +1,71 @@
+"""Scripted stand-in for the Azure OpenAI model, shared by the test modules."""
+import json
+
+from agents import ModelResponse, Usage
+from agents.models.interface import Model
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseContentPartAddedEvent,
+    ResponseOutputItemAddedEvent,
+    ResponseOutputItemDoneEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+)
+
+REPLY = "Happy to help with your trip."
+SAFE = json.dumps({"reasoning": "Airline travel question.", "is_relevant": True, "is_safe": True})
+
+
+def _message(text: str, status: str = "completed") -> ResponseOutputMessage:
+    return ResponseOutputMessage(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        status=status,
+        content=[ResponseOutputText(type="output_text", text=text, annotations=[])],
+    )
+
+
+def _response(text: str) -> Response:
+    return Response(
+        id="resp_1",
+        created_at=0,
+        model="fake",
+        object="response",
+        parallel_tool_calls=False,
+        tool_choice="auto",
+        tools=[],
+        output=[_message(text)],
+    )
+
+
+class FakeModel(Model):
+    """Answers guardrail checks as safe and replies to every agent turn with REPLY."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def get_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing, **kwargs):
+        self.calls.append("guardrail" if output_schema is not None else "agent")
+        response = _response(SAFE if output_schema is not None else REPLY)
+        return ModelResponse(output=response.output, usage=Usage(), response_id=response.id)
+
+    async def stream_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing, **kwargs):
+        self.calls.append("agent")
+        part = ResponseOutputText(type="output_text", text="", annotations=[])
+        yield ResponseOutputItemAddedEvent(
+            type="response.output_item.added", item=_message("", "in_progress"), output_index=0, sequence_number=0
+        )
+        yield ResponseContentPartAddedEvent(
+            type="response.content_part.added", item_id="msg_1", output_index=0, content_index=0, part=part, sequence_number=1
+        )
+        yield ResponseTextDeltaEvent(
+            type="response.output_text.delta", item_id="msg_1", output_index=0, content_index=0,
+            delta=REPLY, logprobs=[], sequence_number=2,
+        )
+        yield ResponseOutputItemDoneEvent(
+            type="response.output_item.done", item=_message(REPLY), output_index=0, sequence_number=3
+        )
+        yield ResponseCompletedEvent(type="response.completed", response=_response(REPLY), sequence_number=4)
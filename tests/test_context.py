@@ -0,0 +1,20 @@
+"""public_context: the UI view of the airline context."""
+from app.airline.context import AirlineAgentContext, public_context
+
+
+def test_hides_internal_fields_and_ungranted_vouchers():
+    ctx = AirlineAgentContext(flight_number="PA441", itinerary=[{"flight_number": "PA441"}], vouchers=[])
+    view = public_context(ctx)
+    assert view["flight_number"] == "PA441"
+    assert "itinerary" not in view and "vouchers" not in view
+
+
+def test_reflects_in_place_mutation():
+    ctx = AirlineAgentContext(vouchers=["MEAL-10"])
+    before = public_context(ctx)
+    ctx.vouchers.append("HOTEL-1")
+    after = public_context(ctx)
+
+    assert after["vouchers"] == ["MEAL-10", "HOTEL-1"]
+    # Each call builds its own dict, so an earlier view is a real snapshot to diff against
+    assert before["vouchers"] == ["MEAL-10"]
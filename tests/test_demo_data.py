@@ -0,0 +1,65 @@
+"""Demo fixtures: read-only data, flight lookups and itinerary hydration."""
+import pytest
+
+from app.airline.context import AirlineAgentContext
+from app.airline.demo_data import (
+    MOCK_ITINERARIES,
+    apply_itinerary_defaults,
+    find_rebook_option,
+    get_flight_segment,
+    get_itinerary_for_flight,
+    match_rebook_options,
+    new_confirmation_number,
+)
+
+
+def test_fixtures_are_read_only():
+    itinerary = MOCK_ITINERARIES["disrupted"]
+    with pytest.raises(TypeError):
+        itinerary["seat_number"] = "1A"
+    with pytest.raises(TypeError):
+        itinerary["segments"][0]["status"] = "On time"
+    assert isinstance(itinerary["segments"], tuple)
+
+
+def test_flight_lookups_are_case_insensitive():
+    assert get_itinerary_for_flight("pa441")[0] == "disrupted"
+    segment, is_rebook = get_flight_segment("NY950")
+    assert segment["destination"] == "Austin (AUS)" and is_rebook
+    assert get_flight_segment(None) is None
+    assert find_rebook_option("disrupted", "ny982")["seat"] == "3C"
+    assert find_rebook_option("disrupted", "XX000") is None
+
+
+def test_match_rebook_options_filters_on_endpoints():
+    assert [o["flight_number"] for o in match_rebook_options("disrupted", "new york", "austin")] == ["NY950", "NY982"]
+    assert match_rebook_options("disrupted", destination="paris") == []
+
+
+def test_defaults_backfill_fields_missing_from_a_hydrated_context():
+    ctx = AirlineAgentContext()
+    apply_itinerary_defaults(ctx, scenario_key="disrupted")
+    ctx.seat_number = None
+    ctx.passenger_name = None
+    ctx.origin = None
+
+    apply_itinerary_defaults(ctx, scenario_key="disrupted")
+
+    assert ctx.seat_number == "14C"
+    assert ctx.passenger_name == "Morgan Lee"
+    assert ctx.origin == "Paris (CDG)"
+    assert ctx.destination == "Austin (AUS)"
+
+
+def test_defaults_keep_existing_values_and_copy_segments():
+    ctx = AirlineAgentContext(seat_number="2A", flight_number="NY802")
+    apply_itinerary_defaults(ctx, scenario_key="disrupted")
+
+    assert ctx.seat_number == "2A" and ctx.flight_number == "NY802"
+    ctx.itinerary[0]["status"] = "On time"
+    assert MOCK_ITINERARIES["disrupted"]["segments"][0]["status"] != "On time"
+
+
+def test_new_confirmation_number_format():
+    number = new_confirmation_number()
+    assert len(number) == 6 and set(number) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567")
@@ -0,0 +1,30 @@
+"""MemoryStore keeps every thread item reachable through paging."""
+import asyncio
+from datetime import datetime, timedelta
+
+from chatkit.types import AssistantMessageContent, AssistantMessageItem, ThreadMetadata
+
+from app.memory_store import MemoryStore
+
+
+def test_long_thread_pages_through_every_item():
+    store = MemoryStore()
+    start = datetime(2026, 1, 1)
+
+    async def run():
+        await store.save_thread(ThreadMetadata(id="thr_1", created_at=start), {})
+        for i in range(600):
+            item = AssistantMessageItem(
+                id=f"msg_{i}", thread_id="thr_1", created_at=start + timedelta(seconds=i),
+                content=[AssistantMessageContent(text=str(i))],
+            )
+            await store.add_thread_item("thr_1", item, {})
+        seen, after = [], None
+        while True:
+            page = await store.load_thread_items("thr_1", after, 100, "asc", {})
+            seen.extend(item.id for item in page.data)
+            if not page.has_more:
+                return seen
+            after = page.after
+
+    assert asyncio.run(run()) == [f"msg_{i}" for i in range(600)]
@@ -0,0 +1,50 @@
+"""Deterministic pre-router in front of the triage agent."""
+import pytest
+
+from app.airline.agents import (
+    booking_cancellation_agent,
+    faq_agent,
+    flight_information_agent,
+    refunds_compensation_agent,
+    seat_special_services_agent,
+)
+from app.airline.orchestrator import _fast_route
+
+
+@pytest.mark.parametrize(
+    ("text", "agent"),
+    [
+        # The UI's starter prompts
+        ("Can you move me to seat 14C?", seat_special_services_agent),
+        ("What's the status of flight FLT-123?", flight_information_agent),
+        (
+            "My flight from Paris to New York was delayed and I missed my connection to Austin. "
+            "Also, my checked bag is missing and I need to spend the night in New York. Can you help me?",
+            flight_information_agent,
+        ),
+        ("I'd like to change my seat", seat_special_services_agent),
+        ("Please cancel my booking", booking_cancellation_agent),
+        ("Can I get a refund for my ticket?", refunds_compensation_agent),
+        ("What is the baggage allowance?", faq_agent),
+    ],
+)
+def test_routes_unambiguous_intent(text, agent):
+    assert _fast_route(text) is agent
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Topic words without a request
+        "How many seats are on the plane?",
+        "What is your policy on delays?",
+        "How do I join the status match program?",
+        "Is there a wifi connection on board?",
+        # Mixed intents
+        "Cancel my flight and I want a refund",
+        "Change my seat and what's the status of my flight?",
+        "",
+    ],
+)
+def test_leaves_everything_else_to_triage(text):
+    assert _fast_route(text) is None
@@ -0,0 +1,35 @@
+"""PromptTemplate fragments, partial substitution and the cached per-agent renderers."""
+import pytest
+
+from app.airline.prompts.loader import PromptTemplate, compile_prompt, load_template
+
+
+def test_render_leaves_missing_placeholders_verbatim():
+    template = PromptTemplate.parse("Flight {flight} for {name}.")
+    assert template.render({"flight": "PA441"}) == "Flight PA441 for {name}."
+
+
+def test_partial_bakes_in_constants():
+    template = PromptTemplate.parse("{prefix} Seat {seat} on {flight}.").partial({"prefix": "Note:"})
+    assert template.render({"seat": "14C", "flight": "PA441"}) == "Note: Seat 14C on PA441."
+
+
+def test_as_format_escapes_percent_and_keeps_order():
+    fmt = PromptTemplate.parse("100% refund for {confirmation} on {flight}").as_format("confirmation", "flight")
+    assert fmt % ("ABC123", "PA441") == "100% refund for ABC123 on PA441"
+
+
+def test_as_format_rejects_mismatched_names():
+    with pytest.raises(ValueError):
+        PromptTemplate.parse("{a} then {b}").as_format("b", "a")
+
+
+def test_compile_prompt_matches_render_and_caches():
+    render = compile_prompt("booking", {"RECOMMENDED_PROMPT_PREFIX": "PREFIX"}, "confirmation", "flight")
+    expected = load_template("booking").render(
+        {"RECOMMENDED_PROMPT_PREFIX": "PREFIX", "confirmation": "ABC123", "flight": "PA441"}
+    )
+
+    assert render("ABC123", "PA441") == expected
+    assert render("ABC123", "PA441") is render("ABC123", "PA441")
+    assert render.cache_info().hits == 2
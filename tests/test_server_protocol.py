@@ -0,0 +1,100 @@
+"""Runner-panel wire format: SSE frames and state deltas."""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+from chatkit.types import AssistantMessageContent, ThreadMetadata
+
+from app.server import MAX_EVENTS, AgentEvent, AirlineServer, _fan_out, _json_native, sse_frame
+
+THREAD = ThreadMetadata(id="thr_1", created_at=datetime(2026, 1, 1))
+
+
+def _events(*ids: str) -> list[AgentEvent]:
+    return [
+        AgentEvent.model_construct(id=i, type="message", agent="Triage Agent", content=i, metadata=None, timestamp=0)
+        for i in ids
+    ]
+
+
+def _frames(queue: asyncio.Queue) -> list[dict]:
+    frames = []
+    while not queue.empty():
+        frames.append(orjson.loads(queue.get_nowait()[len(b"data: "):]))
+    return frames
+
+
+def test_json_native_normalizes_nested_values():
+    output = {
+        "booked_at": datetime(2026, 1, 1, 9, 30),
+        "fees": [Decimal("25.00"), {"refund": Decimal("10.5")}],
+        "message": AssistantMessageContent(text="done"),
+        "segments": ("PA441", "NY802"),
+    }
+    frame = sse_frame({"tool_result": _json_native(output)})
+
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    decoded = orjson.loads(frame[len(b"data: "):])["tool_result"]
+    assert decoded["booked_at"] == "2026-01-01 09:30:00"
+    assert decoded["fees"] == ["25.00", {"refund": "10.5"}]
+    assert decoded["message"]["text"] == "done"
+    assert decoded["segments"] == ["PA441", "NY802"]
+
+
+def test_state_deltas_carry_seq_and_event_offsets():
+    async def run():
+        server = AirlineServer()
+        queue = server.register_listener(THREAD.id)
+        state = server._state_for_thread(THREAD.id)
+
+        state.add_events(_events("e1", "e2"))
+        server._push_state(THREAD)
+        state.add_events(_events("e3"))
+        state.context.vouchers = ["MEAL-10"]
+        server._push_state(THREAD)
+        state.context.vouchers.append("HOTEL-1")
+        server._push_state(THREAD)
+        return _frames(queue)
+
+    first, second, third = asyncio.run(run())
+
+    assert [f["seq"] for f in (first, second, third)] == [1, 2, 3]
+    assert (first["events_offset"], [e["id"] for e in first["events_delta"]]) == (0, ["e1", "e2"])
+    assert (second["events_offset"], [e["id"] for e in second["events_delta"]]) == (2, ["e3"])
+    assert (third["events_offset"], third["events_delta"]) == (3, [])
+    # Only changed context fields travel, including in-place mutations
+    assert second["context_patch"] == {"vouchers": ["MEAL-10"]}
+    assert third["context_patch"] == {"vouchers": ["MEAL-10", "HOTEL-1"]}
+    # Guardrails are sent once, then only when replaced
+    assert "guardrails" in first and "guardrails" not in second
+
+
+def test_delta_offset_counts_evicted_events():
+    async def run():
+        server = AirlineServer()
+        queue = server.register_listener(THREAD.id)
+        state = server._state_for_thread(THREAD.id)
+        state.add_events(_events(*(f"e{i}" for i in range(MAX_EVENTS + 20))))
+        server._push_state(THREAD)
+        return _frames(queue)
+
+    [frame] = asyncio.run(run())
+
+    # Only the retained events are sent, offset by the evicted ones
+    assert frame["events_offset"] == 20
+    assert len(frame["events_delta"]) == MAX_EVENTS
+    assert frame["events_delta"][0]["id"] == "e20"
+
+
+def test_fan_out_drops_oldest_frame_for_a_full_queue():
+    async def run():
+        slow, fast = asyncio.Queue(maxsize=2), asyncio.Queue(maxsize=8)
+        for payload in (b"1", b"2", b"3"):
+            _fan_out([slow, fast], payload)
+        return [slow.get_nowait() for _ in range(slow.qsize())], fast.qsize()
+
+    slow_frames, fast_count = asyncio.run(run())
+
+    assert slow_frames == [b"2", b"3"]
+    assert fast_count == 3